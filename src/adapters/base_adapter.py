@@ -3,7 +3,7 @@ from typing import List, Dict
 
 class NewsAdapter(ABC):
     @abstractmethod
-    def fetch(self) -> List[Dict]:
+    async def fetch(self) -> List[Dict]:
         """Return standardized news items:
         [{
             "title": str,
@@ -18,4 +18,4 @@ class NewsAdapter(ABC):
     @abstractmethod
     def handle_errors(self, error: Exception):
         """Adapter-specific error handling"""
-        pass 
\ No newline at end of file
+        pass
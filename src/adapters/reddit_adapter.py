@@ -1,22 +1,30 @@
 from .base_adapter import NewsAdapter
-import praw
+import asyncpraw
+import logging
+
+logger = logging.getLogger(__name__)
 
 class RedditAdapter(NewsAdapter):
     def __init__(self, config):
-        self.client = praw.Reddit(
+        self.client = asyncpraw.Reddit(
             client_id=config['client_id'],
             client_secret=config['client_secret'],
             user_agent=config['user_agent']
         )
-        
-    def fetch(self) -> list:
+        self._subreddit = None
+
+    async def fetch(self) -> list:
         try:
-            submissions = self.client.subreddit('worldnews').hot(limit=10)
-            return [self._format_post(post) for post in submissions]
+            if self._subreddit is None:
+                self._subreddit = await self.client.subreddit('worldnews')
+            return [self._format_post(post) async for post in self._subreddit.hot(limit=10)]
         except Exception as e:
             self.handle_errors(e)
             return []
-            
+
+    async def close(self):
+        await self.client.close()
+
     def _format_post(self, post):
         return {
             'title': post.title,
@@ -25,6 +33,6 @@ class RedditAdapter(NewsAdapter):
             'published_at': post.created_utc,
             'url': post.url
         }
-        
+
     def handle_errors(self, error: Exception):
         logger.error(f"Reddit API error: {str(error)}")
@@ -1,39 +1,208 @@
 from .base_adapter import NewsAdapter
+import asyncio
+import aiohttp
+import calendar
 import feedparser
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
 from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+PARSE_CACHE_SIZE = 256
+MIN_POLL_INTERVAL = 60
+MAX_POLL_INTERVAL = 3600
+
+@dataclass
+class FeedState:
+    """Adaptive polling state for one feed; times are wall-clock so they survive restarts."""
+    last_modified: Optional[str] = None
+    last_new_entry_ts: float = 0.0
+    current_interval_s: float = MIN_POLL_INTERVAL
+    next_poll: float = 0.0
+
 class RSSAdapter(NewsAdapter):
-    def __init__(self, config):
+    def __init__(self, config, session: Optional[aiohttp.ClientSession] = None,
+                 connector: Optional[aiohttp.TCPConnector] = None):
         self.feeds = config.get('rss_feeds', [])
-        
-    def fetch(self) -> list:
-        items = []
-        for feed_url in self.feeds:
-            try:
-                feed = feedparser.parse(feed_url)
-                for entry in feed.entries:
-                    items.append(self._format_entry(entry, feed_url))
-            except Exception as e:
-                self.handle_errors(e, feed_url)
-        return items
-
-    def _format_entry(self, entry, feed_url):
-        return {
-            'title': entry.get('title', 'No Title'),
-            'content': entry.get('description', ''),
-            'source': feed_url,
-            'published_at': self._parse_date(entry),
-            'url': entry.get('link', '')
-        }
+        self.timeout = aiohttp.ClientTimeout(total=config.get('request_timeout', 10))
+
+        # A session handed in by the application is shared and never closed here
+        self._session = session
+        self._owns_session = session is None
+        # Likewise an injected connector (see core.async_fetcher.get_shared_connector)
+        self._connector = connector
+
+        # Validators from the last successful response, used for conditional GETs
+        self._etags: Dict[str, str] = {}
+        self._modified: Dict[str, str] = {}
+
+        # url -> (etag or body digest, formatted items); skips re-parsing unchanged feeds
+        self._parse_cache: "OrderedDict[str, Tuple[str, List[Dict]]]" = OrderedDict()
 
-    def _parse_date(self, entry):
+        # Quiet feeds back off towards MAX_POLL_INTERVAL, active ones speed up again
+        self._state_path = config.get('feed_state_path')
+        self._feed_state: Dict[str, FeedState] = self._load_feed_state()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            if self._connector is not None:
+                self._session = aiohttp.ClientSession(
+                    timeout=self.timeout,
+                    connector=self._connector,
+                    connector_owner=False
+                )
+            else:
+                self._session = aiohttp.ClientSession(
+                    timeout=self.timeout,
+                    connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+                )
+            self._owns_session = True
+        return self._session
+
+    async def fetch(self) -> list:
+        session = await self._get_session()
+        now = time.time()
+        # Parsed items are not persisted, so a feed with nothing cached (e.g. after a
+        # restart) is fetched now even if its restored schedule says otherwise
+        due = [url for url in self.feeds
+               if now >= self._state(url).next_poll or url not in self._parse_cache]
+        results = await asyncio.gather(*[self._fetch_one(session, url) for url in due])
+        # Feeds that are not due yet contribute their last parsed items
+        results.extend(self._cached_items(url) for url in self.feeds if url not in due)
+        if due:
+            self._save_feed_state()
+        return [item for feed_items in results for item in feed_items]
+
+    def _state(self, feed_url: str) -> FeedState:
+        state = self._feed_state.get(feed_url)
+        if state is None:
+            state = self._feed_state[feed_url] = FeedState()
+        return state
+
+    def _record_poll(self, feed_url: str, has_new: bool):
+        state = self._state(feed_url)
+        now = time.time()
+        if has_new:
+            state.last_new_entry_ts = now
+            state.current_interval_s = max(state.current_interval_s * 0.5, MIN_POLL_INTERVAL)
+        else:
+            state.current_interval_s = min(state.current_interval_s * 1.5, MAX_POLL_INTERVAL)
+        state.last_modified = self._modified.get(feed_url)
+        state.next_poll = now + state.current_interval_s
+
+    def _load_feed_state(self) -> Dict[str, FeedState]:
+        if not self._state_path:
+            return {}
         try:
-            return datetime(*entry.published_parsed[:6]).isoformat()
-        except:
-            return datetime.now().isoformat()
+            with open(self._state_path, 'r', encoding='utf-8') as f:
+                raw = json.load(f)
+            states = {url: FeedState(**fields) for url, fields in raw.items()}
+            # Restore Last-Modified for later conditional polls; it is only sent once
+            # the feed has parsed items again to fall back on (see _fetch_one)
+            for url, state in states.items():
+                if state.last_modified:
+                    self._modified[url] = state.last_modified
+            return states
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.error(f"Error loading RSS feed state: {str(e)}")
+            return {}
+
+    def _save_feed_state(self):
+        if not self._state_path:
+            return
+        try:
+            tmp_path = f"{self._state_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({url: asdict(state) for url, state in self._feed_state.items()}, f)
+            os.replace(tmp_path, self._state_path)
+        except Exception as e:
+            logger.error(f"Error saving RSS feed state: {str(e)}")
+
+    async def _fetch_one(self, session: aiohttp.ClientSession, feed_url: str,
+                         conditional: bool = True) -> list:
+        # A 304 is only useful with parsed items to return, so validators are sent
+        # only while the feed has a parse cache entry
+        headers = {}
+        if conditional and feed_url in self._parse_cache:
+            if feed_url in self._etags:
+                headers['If-None-Match'] = self._etags[feed_url]
+            if feed_url in self._modified:
+                headers['If-Modified-Since'] = self._modified[feed_url]
+
+        try:
+            async with session.get(feed_url, headers=headers) as resp:
+                if resp.status == 304:
+                    logger.debug(f"RSS feed not modified: {feed_url}")
+                    if feed_url not in self._parse_cache:
+                        # Cache entry evicted while the request was in flight: fetch the body
+                        return await self._fetch_one(session, feed_url, conditional=False)
+                    self._record_poll(feed_url, has_new=False)
+                    return self._cached_items(feed_url)
+                resp.raise_for_status()
+                body = await resp.read()
+                etag = resp.headers.get('ETag')
+                if etag:
+                    self._etags[feed_url] = etag
+                if resp.headers.get('Last-Modified'):
+                    self._modified[feed_url] = resp.headers['Last-Modified']
+
+            version = etag or hashlib.blake2b(body, digest_size=16).hexdigest()
+            cached = self._parse_cache.get(feed_url)
+            if cached and cached[0] == version:
+                self._parse_cache.move_to_end(feed_url)
+                self._record_poll(feed_url, has_new=False)
+                return cached[1]
+
+            feed = feedparser.parse(body)
+            items = self._format_entries(feed.entries, feed_url)
+            seen_urls = {item['url'] for item in cached[1]} if cached else set()
+            self._record_poll(feed_url, has_new=any(item['url'] not in seen_urls for item in items))
+            self._store_parsed(feed_url, version, items)
+            return items
+        except Exception as e:
+            self.handle_errors(e, feed_url)
+            return []
+
+    def _cached_items(self, feed_url: str) -> list:
+        cached = self._parse_cache.get(feed_url)
+        if not cached:
+            return []
+        self._parse_cache.move_to_end(feed_url)
+        return cached[1]
+
+    def _store_parsed(self, feed_url: str, version: str, items: list):
+        self._parse_cache[feed_url] = (version, items)
+        self._parse_cache.move_to_end(feed_url)
+        while len(self._parse_cache) > PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+
+    async def close(self):
+        if self._owns_session and self._session and not self._session.closed:
+            await self._session.close()
+
+    def _format_entries(self, entries, feed_url: str) -> list:
+        # One fallback timestamp per feed instead of a datetime.now() per undated entry
+        now_iso = datetime.now().isoformat()
+        return [{
+            'title': e.get('title', 'No Title'),
+            'content': e.get('description', ''),
+            'source': feed_url,
+            # published_parsed is a UTC struct_time; timegm skips datetime's argument validation
+            'published_at': (
+                datetime.utcfromtimestamp(calendar.timegm(pp)).isoformat()
+                if (pp := e.get('published_parsed')) else now_iso
+            ),
+            'url': e.get('link', '')
+        } for e in entries]
 
     def handle_errors(self, error: Exception, feed_url: str = ''):
         logger.error(f"RSS Error ({feed_url}): {str(error)}")
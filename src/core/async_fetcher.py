@@ -1,21 +1,91 @@
+import asyncio
 import aiohttp
 import logging
-from typing import List, Dict, Any
+import orjson
+from typing import List, Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+def _orjson_dumps(obj: Any) -> str:
+    # aiohttp expects json_serialize to return str; orjson returns bytes
+    return orjson.dumps(obj).decode()
+
+_shared_connector: Optional[aiohttp.TCPConnector] = None
+
+def get_shared_connector() -> aiohttp.TCPConnector:
+    """
+    Process-wide connector so every adapter draws from one keep-alive pool.
+    Must be called from inside the running event loop; the application owns it
+    and closes it on shutdown with close_shared_connector().
+    """
+    global _shared_connector
+    if _shared_connector is None or _shared_connector.closed:
+        _shared_connector = aiohttp.TCPConnector(
+            limit=200,
+            limit_per_host=20,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True
+        )
+    return _shared_connector
+
+async def close_shared_connector():
+    global _shared_connector
+    if _shared_connector is not None and not _shared_connector.closed:
+        await _shared_connector.close()
+    _shared_connector = None
+
 class AsyncFetcher:
-    def __init__(self, timeout: int = 10):
+    def __init__(self, timeout: int = 10, connector: Optional[aiohttp.TCPConnector] = None):
         self.timeout = aiohttp.ClientTimeout(total=timeout)
-        
-    async def fetch(self, session: aiohttp.ClientSession, url: str) -> Dict[str, Any]:
+        self._session: Optional[aiohttp.ClientSession] = None
+        # An injected connector is shared with other clients and never closed here
+        self._connector = connector
+        self._connector_kwargs = dict(
+            limit=100,
+            limit_per_host=10,
+            ttl_dns_cache=300,
+            keepalive_timeout=30
+        )
+
+    async def __aenter__(self) -> "AsyncFetcher":
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Lazily create the shared session so every call reuses its connection pool."""
+        if self._session is None or self._session.closed:
+            if self._connector is not None:
+                self._session = aiohttp.ClientSession(
+                    timeout=self.timeout,
+                    connector=self._connector,
+                    connector_owner=False,
+                    json_serialize=_orjson_dumps
+                )
+            else:
+                self._session = aiohttp.ClientSession(
+                    timeout=self.timeout,
+                    connector=aiohttp.TCPConnector(**self._connector_kwargs),
+                    json_serialize=_orjson_dumps
+                )
+        return self._session
+
+    async def aclose(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def fetch(self, url: str) -> Dict[str, Any]:
         try:
-            async with session.get(url, timeout=self.timeout) as response:
+            session = await self._get_session()
+            async with session.get(url) as response:
                 logger.debug(f"Fetching {url} - Status {response.status}")
                 return {
                     "url": url,
                     "status": response.status,
-                    "content": await response.json(),
+                    "content": await response.json(loads=orjson.loads),
                     "error": None
                 }
         except Exception as e:
@@ -25,4 +95,19 @@ class AsyncFetcher:
                 "status": 500,
                 "content": None,
                 "error": str(e)
-            } 
\ No newline at end of file
+            }
+
+    async def fetch_many(self, urls: List[str], concurrency: int = 20) -> List[Dict[str, Any]]:
+        """
+        Fetch several URLs concurrently over the shared session.
+        At most `concurrency` requests are in flight at once; for single-host
+        workloads keep it at or below the connector's limit_per_host.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _one(url: str) -> Dict[str, Any]:
+            async with sem:
+                return await self.fetch(url)
+
+        # fetch() already converts failures into error dicts
+        return await asyncio.gather(*map(_one, urls))
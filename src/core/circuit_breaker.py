@@ -1,27 +1,139 @@
-from tenacity import RetryCallState, retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+from abc import ABC, abstractmethod
+from tenacity import RetryCallState, retry, retry_if_exception_type, stop_after_attempt
 import logging
+import random
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+class APIError(Exception):
+    """Raised by LLM clients when the upstream API returns an error."""
+
+class CircuitOpenError(Exception):
+    """Raised when a call is short-circuited because the breaker is open."""
+
 class CircuitBreaker:
-    def __init__(self, max_attempts=3, timeout=60):
+    """
+    Closed/Open/Half-Open circuit breaker.
+
+    Closed counts consecutive failures and opens after `failure_threshold`.
+    Open rejects every call until `timeout` seconds have passed, then moves to
+    Half-Open, which lets probe calls through: `success_threshold` successes
+    close the circuit again, a single failure re-opens it.
+
+    The instance is also a tenacity stop hook, bounding retries per call, and
+    provides `backoff` as a jittered exponential wait so that many workers
+    sharing this code do not retry in lockstep.
+
+    State transitions are guarded by a lock so one breaker can be shared by
+    threads calling the same client.
+    """
+
+    def __init__(self, max_attempts=3, timeout=30, failure_threshold=5, success_threshold=2,
+                 base_delay=4.0, max_delay=10.0, jitter_factor=0.1):
         self.max_attempts = max_attempts
         self.timeout = timeout
+        self.failure_threshold = failure_threshold
+        self.success_threshold = success_threshold
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter_factor = jitter_factor
         self._state = "closed"
-        
-    def __call__(self, retry_state: RetryCallState):
+        self._failures = 0
+        self._successes = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def __call__(self, retry_state: RetryCallState) -> bool:
+        """tenacity stop hook: stop once attempts run out or the circuit has opened."""
+        if self._state == "open":
+            return True
         if retry_state.attempt_number >= self.max_attempts:
-            self._state = "open"
-            logger.error("Circuit breaker tripped! Stopping retries.")
-            return False
-        return True
+            logger.error("Retry attempts exhausted. Stopping retries.")
+            return True
+        return False
+
+    def backoff(self, retry_state: RetryCallState) -> float:
+        """tenacity wait hook: capped exponential delay, randomized by +/- jitter_factor."""
+        delay = min(self.base_delay * 2 ** (retry_state.attempt_number - 1), self.max_delay)
+        return delay * (1 + random.uniform(-self.jitter_factor, self.jitter_factor))
+
+    def can_execute(self) -> bool:
+        with self._lock:
+            if self._state == "open":
+                if time.monotonic() - self._opened_at < self.timeout:
+                    return False
+                self._state = "half_open"
+                self._successes = 0
+                logger.info("Circuit breaker half-open, letting probe requests through.")
+            return True
+
+    def record_success(self):
+        with self._lock:
+            if self._state == "half_open":
+                self._successes += 1
+                if self._successes >= self.success_threshold:
+                    self._state = "closed"
+                    self._failures = 0
+                    logger.info("Circuit breaker closed.")
+            else:
+                self._failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            if self._state == "half_open":
+                self._trip()
+                return
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._trip()
+
+    def after_attempt(self, retry_state: RetryCallState):
+        """tenacity after hook: count every failed attempt against the circuit."""
+        if retry_state.outcome is not None and retry_state.outcome.failed:
+            self.record_failure()
+
+    def _trip(self):
+        # Caller holds self._lock
+        self._state = "open"
+        self._opened_at = time.monotonic()
+        self._successes = 0
+        logger.error(f"Circuit breaker tripped! Rejecting calls for {self.timeout}s.")
+
+# Stateless part of the retry setup, shared by every client
+_RETRY_POLICY = dict(
+    retry=retry_if_exception_type((APIError, TimeoutError)),
+    reraise=True
+)
 
 # Usage in LLM Client
-class LLMClient:
-    @retry(
-        stop=CircuitBreaker(max_attempts=3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type((APIError, TimeoutError))
-    )
+class LLMClient(ABC):
+    def __init__(self, max_attempts=3):
+        # Each client trips independently; the retry wrapper is built once here, not per call
+        self._cb = CircuitBreaker(max_attempts=max_attempts)
+        self._generate_with_retry = retry(
+            stop=self._cb,
+            wait=self._cb.backoff,
+            after=self._cb.after_attempt,
+            **_RETRY_POLICY
+        )(self._generate_content_impl)
+
     def generate_content(self, prompt):
-        # API call implementation
\ No newline at end of file
+        if not self._cb.can_execute():
+            raise CircuitOpenError("LLM circuit is open; skipping call")
+        result = self._generate_with_retry(prompt)
+        self._cb.record_success()
+        return result
+
+    def _generate_content_impl(self, prompt):
+        return self._call_api(prompt)
+
+    @abstractmethod
+    def _call_api(self, prompt):
+        """Provider-specific API call; raise APIError or TimeoutError to trigger a retry"""
+        pass
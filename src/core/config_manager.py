@@ -1,17 +1,40 @@
-from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+import functools
 import os
 
+NONCE_SIZE = 12
+DECRYPT_CACHE_SIZE = 256
+
+def _derive_key(secret: bytes) -> bytes:
+    """Derive a 256-bit AES key from the configured secret."""
+    return HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=None,
+        info=b"veritas-config"
+    ).derive(secret)
+
 class ConfigManager:
     def __init__(self):
         self.key = os.getenv("CONFIG_KEY").encode()
-        self.cipher = Fernet(self.key)
-        
+        self._aead = AESGCM(_derive_key(self.key))
+        # Per-instance cache so repeat reads of the same secret skip the AEAD pass.
+        # encrypt_value is never cached: every call must use a fresh nonce.
+        self._decrypt_cached = functools.lru_cache(maxsize=DECRYPT_CACHE_SIZE)(self._decrypt)
+
     def encrypt_value(self, value: str) -> bytes:
-        return self.cipher.encrypt(value.encode())
-    
+        nonce = os.urandom(NONCE_SIZE)
+        return nonce + self._aead.encrypt(nonce, value.encode(), None)
+
     def decrypt_value(self, encrypted: bytes) -> str:
-        return self.cipher.decrypt(encrypted).decode()
-    
+        return self._decrypt_cached(bytes(encrypted))
+
+    def _decrypt(self, encrypted: bytes) -> str:
+        return self._aead.decrypt(encrypted[:NONCE_SIZE], encrypted[NONCE_SIZE:], None).decode()
+
     def rotate_key(self, new_key: str):
-        # Implementation for key rotation
-        pass
\ No newline at end of file
+        self.key = new_key.encode()
+        self._aead = AESGCM(_derive_key(self.key))
+        self._decrypt_cached.cache_clear()
@@ -5,8 +5,13 @@ Usage: python click_coords.py [--help] [--mode MODE] [--hotkey]
 """
 
 import sys
+import ctypes
 import pyautogui
 import argparse
+import asyncio
+import cv2
+import mss
+import numpy as np
 from pynput import mouse, keyboard
 from datetime import datetime
 import pyperclip
@@ -14,9 +19,23 @@ from collections import deque
 import tkinter as tk
 from PIL import Image, ImageTk, ImageDraw
 import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
 import os
 import time
 
+def _fmt_simple(x, y):
+    return f"X: {x:<4}  Y: {y}"
+
+def _fmt_hex(x, y):
+    return f"0x{x:04X}:0x{y:04X}"
+
+def _fmt_css(x, y):
+    return f"{x}px {y}px"
+
+def _fmt_tuple(x, y):
+    return f"({x}, {y})"
+
 class SmartCoordTracker:
     def __init__(self, args):
         self.args = args
@@ -33,13 +52,38 @@ class SmartCoordTracker:
         self.persistent_targets = []
         self.detection_active = False  # Add shutdown flag
         
+        # Detectors run as coroutines on one event loop thread; the blocking
+        # screen grab and match run on a single scan worker
+        self._loop = None
+        self._scan_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='coords-scan')
+        self._detectors = []
+        
+        # Screen device context for single-pixel reads on Windows (acquired once)
+        self._screen_dc = self._get_screen_dc() if sys.platform == 'win32' else None
+        
+        # One screen grabber shared by the detectors; a frame is reused within a tick
+        self._sct = None
+        self._grab_lock = threading.Lock()
+        self._frame = None
+        self._frame_ts = 0.0
+        
+        # Single persistent overlay window, fed through a queue from any thread
+        self._overlay_queue = queue.Queue()
+        self._overlay_lock = threading.Lock()
+        self._overlay_started = False
+        self._root = None
+        self._canvas = None
+        self._markers = {}  # label -> (canvas tag, x, y) for persistent labelled markers
+        self._marker_seq = 0
+        
         # Set up output formats
         self.formats = {
-            'simple': lambda x, y: f"X: {x:<4}  Y: {y}",
-            'hex': lambda x, y: f"0x{x:04X}:0x{y:04X}",
-            'css': lambda x, y: f"{x}px {y}px",
-            'tuple': lambda x, y: f"({x}, {y})"
+            'simple': _fmt_simple,
+            'hex': _fmt_hex,
+            'css': _fmt_css,
+            'tuple': _fmt_tuple
         }
+        self._fmt = self.formats[args.mode]  # Active formatter, rebound by toggle_mode
         
         # Process manual targets provided via command-line
         if args.target:
@@ -52,32 +96,96 @@ class SmartCoordTracker:
                     
         if args.image:
             self.detection_image = args.image
+            self._image_template = self._load_template(args.image)
             self.detection_active = True
-            threading.Thread(target=self.detect_image_loop, daemon=True).start()
+            self._spawn(self.detect_image_loop())
         else:
             self.detection_image = None
         
+    def _spawn(self, coro):
+        """Schedule a detector coroutine on the shared event loop thread"""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        self._detectors.append(asyncio.run_coroutine_threadsafe(coro, self._loop))
+
+    async def _scan(self, template, threshold):
+        """Run _locate on the scan worker without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._scan_pool, self._locate, template, threshold)
+
+    @staticmethod
+    def _get_screen_dc():
+        """Declare the GDI signatures (ctypes defaults to c_int, which truncates the HDC
+        and turns CLR_INVALID into -1), then acquire the screen DC."""
+        from ctypes import wintypes
+        user32, gdi32 = ctypes.windll.user32, ctypes.windll.gdi32
+        user32.GetDC.argtypes = [wintypes.HWND]
+        user32.GetDC.restype = wintypes.HDC
+        user32.ReleaseDC.argtypes = [wintypes.HWND, wintypes.HDC]
+        gdi32.GetPixel.argtypes = [wintypes.HDC, ctypes.c_int, ctypes.c_int]
+        gdi32.GetPixel.restype = ctypes.c_uint32
+        return user32.GetDC(None)
+
     def get_rgb(self, x, y):
         """Get pixel color at coordinates"""
         try:
-            # Taking a full screenshot might be heavy but works for most cases.
-            return pyautogui.screenshot().getpixel((x, y))
+            if self._screen_dc:
+                color = ctypes.windll.gdi32.GetPixel(self._screen_dc, x, y)
+                if color != 0xFFFFFFFF:  # CLR_INVALID
+                    return (color & 0xFF, (color >> 8) & 0xFF, (color >> 16) & 0xFF)
+            # Grab only the 1x1 region instead of the whole desktop
+            return pyautogui.screenshot(region=(x, y, 1, 1)).getpixel((0, 0))
         except Exception:
             return (0, 0, 0)
 
+    def _load_template(self, image_path):
+        """Decode a template image once, in grayscale, for cv2.matchTemplate"""
+        template = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+        if template is None:
+            raise FileNotFoundError(f"Template image not readable: {image_path}")
+        return template
+
+    def _grab_gray(self, max_age=0.5):
+        """Grab the primary monitor as grayscale, sharing recent frames between detectors"""
+        with self._grab_lock:
+            now = time.monotonic()
+            if self._frame is None or now - self._frame_ts >= max_age:
+                if self._sct is None:
+                    self._sct = mss.mss()
+                monitor = self._sct.monitors[1]
+                img = np.asarray(self._sct.grab(monitor))
+                gray = cv2.cvtColor(img, cv2.COLOR_BGRA2GRAY)
+                self._frame = (gray, monitor['left'], monitor['top'])
+                self._frame_ts = now
+            return self._frame
+
+    def _locate(self, template, threshold):
+        """Return the screen center of the best template match, or None below threshold"""
+        gray, left, top = self._grab_gray()
+        res = cv2.matchTemplate(gray, template, cv2.TM_CCOEFF_NORMED)
+        _, max_val, _, max_loc = cv2.minMaxLoc(res)
+        if max_val < threshold:
+            return None
+        th, tw = template.shape[:2]
+        return (left + max_loc[0] + tw // 2, top + max_loc[1] + th // 2)
+
     def show_help(self):
         """Display help information"""
         print("\nSmart Click Modes:")
-        print("  C: Toggle coordinate display format")
-        print("  R: Toggle RGB color display")
+        print("  Ctrl+Alt+C: Toggle coordinate display format")
+        print("  Ctrl+Alt+R: Toggle RGB color display")
         print("  S: Save current position to history")
-        print("  H: Show this help")
-        print("  Q: Quit\n")
+        print("  Ctrl+Alt+H: Show this help")
+        print("  Ctrl+Alt+Q: Quit\n")
 
     def on_click(self, x, y, button, pressed):
         """Handle mouse click events"""
+        # Only left-button presses matter; drop everything else before any other work
+        if button != mouse.Button.left or not pressed:
+            return True
         try:
-            if pressed and not self.hotkey_active:
+            if not self.hotkey_active:
                 self.process_coords(x, y)
                 return not self.args.exit_after
         except Exception as e:
@@ -94,50 +202,83 @@ class SmartCoordTracker:
 
     def create_overlay_window(self, x, y, persistent=False, label=None, color='red'):
         """
-        Modified overlay creator with customizable labels and colors
+        Modified overlay creator with customizable labels and colors.
+        Markers are drawn on one shared transparent window owned by the Tk thread.
         """
-        def run_overlay():
-            win = tk.Tk()
-            win.attributes('-alpha', 0.7)
-            win.attributes('-topmost', True)
-            win.overrideredirect(True)
-            win.attributes('-transparentcolor', 'white')
-            win.geometry(f"100x100+{x-50}+{y-50}")
-            
-            canvas = tk.Canvas(win, bg='white', highlightthickness=0)
-            canvas.pack(fill=tk.BOTH, expand=True)
-            
-            # Customizable elements
-            canvas.create_oval(10, 10, 90, 90, outline=color, width=2)
-            canvas.create_line(50, 20, 50, 80, fill=color, width=2)
-            canvas.create_line(20, 50, 80, 50, fill=color, width=2)
-            
-            display_text = label if label else f"{x},{y}"
-            canvas.create_text(50, 95, text=display_text,
-                              fill=color, anchor=tk.N, font=('Arial', 8))
-            
-            if not persistent:
-                win.after(2000, win.destroy)
-            win.mainloop()
+        with self._overlay_lock:
+            if not self._overlay_started:
+                self._overlay_started = True
+                threading.Thread(target=self._run_overlay_root, daemon=True).start()
+        self._overlay_queue.put((x, y, persistent, label, color))
+
+    def _run_overlay_root(self):
+        """Own the full-screen overlay window and its Tk mainloop"""
+        root = tk.Tk()
+        root.attributes('-alpha', 0.7)
+        root.attributes('-topmost', True)
+        root.overrideredirect(True)
+        root.attributes('-transparentcolor', 'white')
+        root.geometry(f"{root.winfo_screenwidth()}x{root.winfo_screenheight()}+0+0")
+        
+        self._canvas = tk.Canvas(root, bg='white', highlightthickness=0)
+        self._canvas.pack(fill=tk.BOTH, expand=True)
+        self._root = root
+        
+        root.after(16, self._drain_overlays)
+        root.mainloop()
+
+    def _drain_overlays(self):
+        """Draw queued markers; runs on the Tk thread every ~16ms"""
+        try:
+            while True:
+                self._draw_marker(*self._overlay_queue.get_nowait())
+        except queue.Empty:
+            pass
+        self._root.after(16, self._drain_overlays)
+
+    def _draw_marker(self, x, y, persistent, label, color):
+        canvas = self._canvas
         
-        threading.Thread(target=run_overlay, daemon=True).start()
+        # A persistent labelled marker is moved rather than drawn again
+        if persistent and label in self._markers:
+            tag, old_x, old_y = self._markers[label]
+            canvas.move(tag, x - old_x, y - old_y)
+            self._markers[label] = (tag, x, y)
+            return
+        
+        self._marker_seq += 1
+        tag = f"marker{self._marker_seq}"
+        
+        # Customizable elements
+        canvas.create_oval(x - 40, y - 40, x + 40, y + 40, outline=color, width=2, tags=tag)
+        canvas.create_line(x, y - 30, x, y + 30, fill=color, width=2, tags=tag)
+        canvas.create_line(x - 30, y, x + 30, y, fill=color, width=2, tags=tag)
+        
+        display_text = label if label else f"{x},{y}"
+        canvas.create_text(x, y + 45, text=display_text,
+                           fill=color, anchor=tk.N, font=('Arial', 8), tags=tag)
+        
+        if not persistent:
+            canvas.after(2000, canvas.delete, tag)
+        elif label:
+            self._markers[label] = (tag, x, y)
 
-    def detect_image_loop(self):
+    async def detect_image_loop(self):
         """Continuously detect specified image and mark its location"""
         while self.detection_active:
             try:
-                location = pyautogui.locateCenterOnScreen(self.detection_image, confidence=0.8)
+                location = await self._scan(self._image_template, 0.8)
                 if location:
                     self.create_overlay_window(
-                        location.x, 
-                        location.y,
+                        location[0],
+                        location[1],
                         persistent=True,
                         color='#00FF00',  # Bright green
                         label='THREE DOTS'
                     )
             except Exception as e:
                 print(f"Image detection error: {e}")
-            time.sleep(1)
+            await asyncio.sleep(1.0)
 
     def process_coords(self, x, y):
         """Process and display coordinates with optional features"""
@@ -145,7 +286,7 @@ class SmartCoordTracker:
         output = []
         
         # Format coordinates based on selected mode
-        output.append(self.formats[self.args.mode](x, y))
+        output.append(self._fmt(x, y))
         
         # Append RGB information if requested
         if self.args.rgb:
@@ -175,44 +316,45 @@ class SmartCoordTracker:
             # Use --persist flag to decide whether the overlay is persistent
             self.create_overlay_window(x, y, persistent=self.args.persist)
 
-    def detect_three_dots(self):
-        """Background thread to continuously detect the three dots image,
+    async def detect_three_dots(self):
+        """Background coroutine to continuously detect the three dots image,
            move the mouse to its center, and click once found."""
         try:
             # Set the image_path directly to the provided location
             image_path = r"M:\ReactProjects\AutoNews\auto-news-channel\src\data\pyautogui_image_files\three_dots_image.png"
             
+            template = self._load_template(image_path)
+            
             print(f"🔍 Three dots detection active using image: {image_path}")
             self.detection_active = True
             
             # Loop continuously as long as detection is active
             while self.detection_active:
                 try:
-                    # Check frequently with a short delay to avoid high CPU usage
-                    for _ in range(10):  # 10 iterations * 0.1s = 1 second total
-                        if not self.detection_active:
-                            return
-                        time.sleep(0.1)
+                    # Wait one second between scans; stop() cancels the sleep
+                    await asyncio.sleep(1.0)
                     
                     # Search for the image on screen
-                    location = pyautogui.locateCenterOnScreen(image_path, confidence=0.7)
+                    location = await self._scan(template, 0.7)
                     if location and self.detection_active:
+                        x, y = location
                         # Provide visual feedback using overlay (optional)
                         self.create_overlay_window(
-                            location.x,
-                            location.y,
+                            x,
+                            y,
                             persistent=True,
                             color='#00FF00',
                             label='THREE DOTS'
                         )
                         
                         # Move the mouse to the detected location and click
-                        print(f"✅ Three dots found at ({location.x}, {location.y}). Moving and clicking...")
-                        pyautogui.moveTo(location.x, location.y, duration=0.5)
-                        pyautogui.click()
+                        print(f"✅ Three dots found at ({x}, {y}). Moving and clicking...")
+                        await asyncio.get_running_loop().run_in_executor(
+                            self._scan_pool, self._move_and_click, x, y
+                        )
                         
                         # Optional: add a cooldown to prevent multiple rapid clicks.
-                        time.sleep(3)
+                        await asyncio.sleep(3)
                         
                 except Exception as e:
                     if self.detection_active:  # Only log errors if detection is still enabled
@@ -223,6 +365,10 @@ class SmartCoordTracker:
         finally:
             self.detection_active = False
 
+    def _move_and_click(self, x, y):
+        pyautogui.moveTo(x, y, duration=0.5)
+        pyautogui.click()
+
     def test_three_dots_location(self):
         """Test sequence to find and mark three dots image location"""
         try:
@@ -286,17 +432,17 @@ class SmartCoordTracker:
                 self.create_overlay_window(x, y, persistent=True)
                 print(f"🎯 Persistent target at ({x}, {y})")
             
-            # Start the three dots detection thread if no image flag was provided
+            # Start the three dots detector if no image flag was provided
             if not self.args.image:
-                threading.Thread(target=self.detect_three_dots, daemon=True).start()
+                self._spawn(self.detect_three_dots())
             
             # Keyboard listener
             self.kb_listener = keyboard.GlobalHotKeys({
                 '<ctrl>+<alt>+p': self.on_hotkey,
                 '<ctrl>+<alt>+q': self.stop,
-                'c': self.toggle_mode,
-                'r': lambda: setattr(self.args, 'rgb', not self.args.rgb),
-                'h': self.show_help
+                '<ctrl>+<alt>+c': self.toggle_mode,
+                '<ctrl>+<alt>+r': lambda: setattr(self.args, 'rgb', not self.args.rgb),
+                '<ctrl>+<alt>+h': self.show_help
             })
             self.kb_listener.daemon = True
             self.kb_listener.start()
@@ -314,6 +460,7 @@ class SmartCoordTracker:
         current_idx = modes.index(self.args.mode)
         new_mode = modes[(current_idx + 1) % len(modes)]
         self.args.mode = new_mode
+        self._fmt = self.formats[new_mode]
         if not self.args.quiet:
             print(f"Switched to {new_mode} mode")
 
@@ -321,21 +468,22 @@ class SmartCoordTracker:
         """Stop all listeners and exit the program"""
         try:
             print("\n🛑 Shutting down...")
-            self.detection_active = False  # Signal thread to stop
-            
-            # Extended wait for thread cleanup
-            time.sleep(1.0)  # Increased from 0.5s
+            self.detection_active = False  # Signal detectors to stop
+            for future in self._detectors:
+                future.cancel()  # Interrupts any pending asyncio.sleep immediately
             
             # Stop listeners first
             if self.listener:
                 self.listener.stop()
             if self.kb_listener:
                 self.kb_listener.stop()
+            if self._screen_dc:
+                ctypes.windll.user32.ReleaseDC(0, self._screen_dc)
             
             # Print final positions
             print("📌 Final positions:")
             for idx, (x, y) in enumerate(self.history, 1):
-                print(f"{idx:2}: {self.formats[self.args.mode](x, y)}")
+                print(f"{idx:2}: {self._fmt(x, y)}")
             
             # Force exit
             os._exit(0)
@@ -359,8 +507,8 @@ Common Use Cases:
 Interactive Controls:
   Left Click         - Capture coordinates
   Ctrl+Alt+P         - Get current mouse position
-  C                  - Cycle display formats
-  R                  - Toggle RGB color display
+  Ctrl+Alt+C         - Cycle display formats
+  Ctrl+Alt+R         - Toggle RGB color display
   S                  - Save current position to history
   Ctrl+Alt+Q         - Quit program
 """
@@ -4,12 +4,17 @@ import logging
 import psutil
 import traceback
 import os
-import pyautogui  # For image recognition and clicking
+import pyautogui  # For mouse and keyboard input
 from pywinauto import Application
 from pywinauto.keyboard import send_keys
 import pyperclip  # Clipboard handling
+import win32clipboard
 import json
-import re
+import orjson
+from pathlib import Path
+from core.match import grab_gray, locate, locate_if_changed, locate_many, locate_scored, preload
+from core.screen import load_template, locate_center
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging to include debug level and traceback information
 logging.basicConfig(
@@ -18,23 +23,97 @@ logging.basicConfig(
     datefmt='%Y-%m-%d %H:%M:%S'
 )
 
+TYPE_CHUNK_SIZE = 4096  # Characters per send_keys call when typing instead of pasting
+
+_DATA_DIR = Path(__file__).resolve().parent.parent / "data" / "pyautogui_image_files"
+_IMG = {
+    "create_new": _DATA_DIR / "create_new_image.png",
+    "copy_text": _DATA_DIR / "copy_text_image.png",
+    "text_here": _DATA_DIR / "text_here_asterisk.png",
+    "insert_prompt": _DATA_DIR / "insert_prompt_image.png",
+    "generate_podcast": _DATA_DIR / "generate_podcast_image.png",
+    "play_button": _DATA_DIR / "play_button.png",
+    "three_dots": _DATA_DIR / "three_dots_image.png",
+    "download": _DATA_DIR / "download_image.png",
+    "change_location": _DATA_DIR / "change_download_location_image.png",
+    "select_folder": _DATA_DIR / "select_folder.png",
+}
+
+# Every theme variant of the download icon; download_image.png is always present
+_DOWNLOAD_VARIANTS = {path.stem: path for path in sorted(_DATA_DIR.glob("download_image*.png"))}
+
+def _preload_templates():
+    """Warm the template caches so the first search of each button skips the PNG decode."""
+    preload(list(_IMG.values()) + list(_DOWNLOAD_VARIANTS.values()))
+    load_template(_IMG["change_location"], grayscale=False)  # Edge's color match
+
+def _validate_images():
+    """Check every template image once up front instead of on each helper call."""
+    missing = [str(path) for path in _IMG.values() if not path.exists()]
+    if missing:
+        raise FileNotFoundError(f"Template images missing: {missing}")
+
+# Accessible names the three dots menu button is exposed under
+_MORE_OPTIONS_NAMES = {"more", "more options", "more actions", "view more options"}
+
+DEBUG_ANIMATE = False  # Glide the pointer to each target so a watching human can follow along
+
+def _click(location, duration=0.3):
+    """Click a screen location; animate the pointer there first only when DEBUG_ANIMATE is set."""
+    if DEBUG_ANIMATE:
+        pyautogui.moveTo(location, duration=duration)
+        time.sleep(0.2)
+    pyautogui.click(*location)
+
+def poll_until(fn, timeout=None, interval=0.3):
+    """
+    Call fn() until it returns something other than None, for at most `timeout`
+    seconds (None waits indefinitely). `interval` is the sleep between polls, or a
+    callable taking the attempt number for backoff schedules.
+    Returns fn's result, or None on timeout.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    attempt = 0
+    while deadline is None or time.monotonic() < deadline:
+        attempt += 1
+        value = fn()
+        if value is not None:
+            return value
+        time.sleep(interval(attempt) if callable(interval) else interval)
+    return None
+
 #########################
 # Browser-specific functions
 #########################
 
-def close_existing_edge():
-    """Close any existing Microsoft Edge instances to prevent conflicts."""
-    logging.debug("Closing existing Microsoft Edge processes.")
+def _close_by_name(exe_name, label):
+    """Terminate every process whose name contains exe_name and wait for them to exit."""
+    procs = []
     for process in psutil.process_iter(attrs=['pid', 'name']):
         try:
             name = process.info['name']
-            if name and "msedge.exe" in name.lower():
-                logging.info(f"Terminating Edge process with PID: {process.info['pid']}")
-                subprocess.run(["taskkill", "/F", "/PID", str(process.info['pid'])], shell=True)
+            if name and exe_name in name.lower():
+                logging.info(f"Terminating {label} process with PID: {process.info['pid']}")
+                process.terminate()
+                procs.append(process)
+        except psutil.NoSuchProcess:
+            continue
         except Exception as e:
             logging.error("Error iterating processes: " + str(e))
             logging.error(traceback.format_exc())
-    time.sleep(2)
+    # Returns as soon as every process has exited instead of sleeping a fixed time
+    _, alive = psutil.wait_procs(procs, timeout=2)
+    for process in alive:
+        try:
+            logging.warning(f"Killing unresponsive {label} process with PID: {process.pid}")
+            process.kill()
+        except psutil.NoSuchProcess:
+            pass
+
+def close_existing_edge():
+    """Close any existing Microsoft Edge instances to prevent conflicts."""
+    logging.debug("Closing existing Microsoft Edge processes.")
+    _close_by_name("msedge.exe", "Edge")
 
 def open_edge():
     """Launch Edge and wait for it to fully load before connecting."""
@@ -42,18 +121,9 @@ def open_edge():
     try:
         edge_path = r"C:\Program Files (x86)\Microsoft\Edge\Application\msedge.exe"
         subprocess.Popen([edge_path])
-        time.sleep(0.1)
-        app = None
-        for attempt in range(10):
-            try:
-                logging.debug(f"Attempt {attempt+1}: Connecting to Edge window.")
-                app = Application(backend="uia").connect(title_re=".*Edge", timeout=2)
-                break
-            except Exception as e:
-                logging.warning(f"Attempt {attempt+1} failed: {e}")
-                time.sleep(0.5)
-        if not app:
-            raise Exception("Could not connect to Microsoft Edge after several attempts.")
+        logging.debug("Connecting to Edge window.")
+        # pywinauto retries internally every 100ms until the window appears
+        app = Application(backend="uia").connect(title_re=".*Edge", timeout=10, retry_interval=0.1)
         return app
     except Exception as e:
         logging.error("Error launching Edge: " + str(e))
@@ -63,16 +133,7 @@ def open_edge():
 def close_existing_chrome():
     """Close any existing Google Chrome instances to prevent conflicts."""
     logging.debug("Closing existing Google Chrome processes.")
-    for process in psutil.process_iter(attrs=['pid', 'name']):
-        try:
-            name = process.info['name']
-            if name and "chrome.exe" in name.lower():
-                logging.info(f"Terminating Chrome process with PID: {process.info['pid']}")
-                subprocess.run(["taskkill", "/F", "/PID", str(process.info['pid'])], shell=True)
-        except Exception as e:
-            logging.error("Error iterating processes: " + str(e))
-            logging.error(traceback.format_exc())
-    time.sleep(2)
+    _close_by_name("chrome.exe", "Chrome")
 
 def open_chrome():
     """Launch Google Chrome and wait for it to fully load before connecting."""
@@ -84,18 +145,9 @@ def open_chrome():
         if not os.path.exists(chrome_path):
             raise FileNotFoundError("Google Chrome executable not found.")
         subprocess.Popen([chrome_path])
-        time.sleep(0.1)
-        app = None
-        for attempt in range(10):
-            try:
-                logging.debug(f"Attempt {attempt+1}: Connecting to Chrome window.")
-                app = Application(backend="uia").connect(title_re=".*Chrome", timeout=2)
-                break
-            except Exception as e:
-                logging.warning(f"Attempt {attempt+1} failed: {e}")
-                time.sleep(0.5)
-        if not app:
-            raise Exception("Could not connect to Google Chrome after several attempts.")
+        logging.debug("Connecting to Chrome window.")
+        # pywinauto retries internally every 100ms until the window appears
+        app = Application(backend="uia").connect(title_re=".*Chrome", timeout=10, retry_interval=0.1)
         return app
     except Exception as e:
         logging.error("Error launching Chrome: " + str(e))
@@ -106,6 +158,21 @@ def open_chrome():
 # Common functions used in both branches
 #########################
 
+def _window_region(app):
+    """
+    Return the browser window's on-screen rectangle as (left, top, width, height)
+    so image searches only grab and scan that area. Returns None (full screen)
+    if the window rectangle cannot be read.
+    """
+    try:
+        rect = app.top_window().rectangle()
+        # Maximized windows report a few pixels of negative offset; clamp to the screen
+        left, top = max(rect.left, 0), max(rect.top, 0)
+        return (left, top, rect.right - left, rect.bottom - top)
+    except Exception as e:
+        logging.warning(f"Could not read window rectangle, searching full screen: {str(e)}")
+        return None
+
 def navigate_to_notebook(app, url):
     """Navigate to a specific Notebook URL."""
     logging.debug(f"Navigating to: {url}")
@@ -123,31 +190,19 @@ def navigate_to_notebook(app, url):
         logging.error(traceback.format_exc())
         return False
 
-def click_create_new_button():
+def click_create_new_button(region=None):
     """Click the 'Create new' button using pyautogui image recognition."""
     logging.debug("Attempting to click 'Create new' button via image recognition")
     try:
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        parent_dir = os.path.dirname(current_dir)
-        image_path = os.path.join(parent_dir, "data", "pyautogui_image_files", "create_new_image.png")
-        if not os.path.exists(image_path):
-            raise FileNotFoundError(f"Create new button image missing at {image_path}")
+        image_path = _IMG["create_new"]
 
         timeout = 15
         confidence = 0.7
-        start_time = time.time()
-        button_location = None
-        while time.time() - start_time < timeout:
-            button_location = pyautogui.locateCenterOnScreen(image_path, confidence=confidence, grayscale=True)
-            if button_location:
-                break
-            time.sleep(0.3)
+        button_location = poll_until(lambda: locate(image_path, confidence=confidence, region=region), timeout)
         if not button_location:
             raise Exception("Could not locate 'Create new' button image")
         logging.info(f"Found 'Create new' button at {button_location}")
-        pyautogui.moveTo(button_location, duration=0.3)
-        time.sleep(0.2)
-        pyautogui.click()
+        _click(button_location)
         time.sleep(1)
         return True
     except Exception as e:
@@ -155,31 +210,19 @@ def click_create_new_button():
         logging.error(traceback.format_exc())
         return False
 
-def click_copy_text_button():
+def click_copy_text_button(region=None):
     """Click the 'Copy text' button using pyautogui image recognition."""
     logging.debug("Attempting to click 'Copy text' button via image recognition")
     try:
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        parent_dir = os.path.dirname(current_dir)
-        image_path = os.path.join(parent_dir, "data", "pyautogui_image_files", "copy_text_image.png")
-        if not os.path.exists(image_path):
-            raise FileNotFoundError(f"Copy text button image missing at {image_path}")
+        image_path = _IMG["copy_text"]
 
         timeout = 15
         confidence = 0.9
-        start_time = time.time()
-        button_location = None
-        while time.time() - start_time < timeout:
-            button_location = pyautogui.locateCenterOnScreen(image_path, confidence=confidence, grayscale=True)
-            if button_location:
-                break
-            time.sleep(0.3)
+        button_location = poll_until(lambda: locate(image_path, confidence=confidence, region=region), timeout)
         if not button_location:
             raise Exception("Could not locate 'Copy text' button image")
         logging.info(f"Found 'Copy text' button at {button_location}")
-        pyautogui.moveTo(button_location, duration=0.3)
-        time.sleep(0.2)
-        pyautogui.click()
+        _click(button_location)
         time.sleep(1)
         return True
     except Exception as e:
@@ -187,31 +230,19 @@ def click_copy_text_button():
         logging.error(traceback.format_exc())
         return False
 
-def click_text_here_asterisk():
+def click_text_here_asterisk(region=None):
     """Click the 'text_here_*' target area using image recognition."""
     logging.debug("Attempting to click 'text_here_*' area via image recognition")
     try:
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        parent_dir = os.path.dirname(current_dir)
-        image_path = os.path.join(parent_dir, "data", "pyautogui_image_files", "text_here_asterisk.png")
-        if not os.path.exists(image_path):
-            raise FileNotFoundError(f"Text target image missing at {image_path}")
+        image_path = _IMG["text_here"]
 
         timeout = 15
         confidence = 0.7
-        start_time = time.time()
-        button_location = None
-        while time.time() - start_time < timeout:
-            button_location = pyautogui.locateCenterOnScreen(image_path, confidence=confidence, grayscale=True)
-            if button_location:
-                break
-            time.sleep(0.3)
+        button_location = poll_until(lambda: locate(image_path, confidence=confidence, region=region), timeout)
         if not button_location:
             raise Exception("Could not locate 'text_here_*' target image")
         logging.info(f"Found text target area at {button_location}")
-        pyautogui.moveTo(button_location, duration=0.3)
-        time.sleep(0.2)
-        pyautogui.click()
+        _click(button_location)
         time.sleep(1)
         return True
     except Exception as e:
@@ -219,95 +250,141 @@ def click_text_here_asterisk():
         logging.error(traceback.format_exc())
         return False
 
+def wait_until_gone(name, region=None, timeout=10, confidence=0.8):
+    """Wait for a template to disappear, e.g. a dialog button once the dialog closes."""
+    return poll_until(lambda: True if locate(_IMG[name], confidence=confidence, region=region) is None else None,
+                      timeout) is not None
+
+def click_sequence(steps, region=None, timeout=15):
+    """
+    Click several targets in order, e.g. [("create_new", 0.7), ("copy_text", 0.9)].
+    Each poll grabs the screen once and matches every remaining template, so the
+    next target is clicked as soon as it is visible rather than after a fixed sleep.
+    Returns True once every step has been clicked.
+    """
+    confidences = dict(steps)
+    for i, (name, _) in enumerate(steps):
+        remaining = {n: _IMG[n] for n, _ in steps[i:]}
+
+        def _poll():
+            found = locate_many(remaining, region=region, confidences=confidences)
+            if not found[name] and any(found.values()):
+                logging.debug(f"Waiting for '{name}'; later targets already visible: {[n for n, loc in found.items() if loc]}")
+            return found[name]
+
+        # Each step gets the full timeout
+        location = poll_until(_poll, timeout)
+        if not location:
+            logging.error(f"Could not locate '{name}' button image")
+            return False
+        logging.info(f"Found '{name}' at {location}")
+        _click(location)
+    return True
+
 def get_latest_narration_file():
     """Finds the most recent narration file in the data/narration directory."""
     try:
         current_dir = os.path.dirname(os.path.abspath(__file__))
         project_root = os.path.dirname(os.path.dirname(current_dir))
         narration_dir = os.path.join(project_root, "data", "narration")
-        files = [f for f in os.listdir(narration_dir) if f.startswith("final_narration") and f.endswith(".json")]
-        if not files:
+        # scandir entries carry their stat data on Windows, and max() avoids a full sort
+        with os.scandir(narration_dir) as it:
+            entries = [e for e in it if e.name.startswith("final_narration") and e.name.endswith(".json")]
+        if not entries:
             raise FileNotFoundError("No narration files found")
-        files.sort(key=lambda x: os.path.getmtime(os.path.join(narration_dir, x)), reverse=True)
-        return os.path.join(narration_dir, files[0])
+        return max(entries, key=lambda e: e.stat().st_mtime).path
     except Exception as e:
         logging.error(f"Error finding narration file: {str(e)}")
         logging.error(traceback.format_exc())
         return None
 
+def _set_clipboard(text, attempts=3):
+    """Put text on the clipboard, retrying briefly if another process holds it open."""
+    for attempt in range(attempts):
+        try:
+            win32clipboard.OpenClipboard()
+            try:
+                win32clipboard.EmptyClipboard()
+                win32clipboard.SetClipboardData(win32clipboard.CF_UNICODETEXT, text)
+            finally:
+                win32clipboard.CloseClipboard()
+            return True
+        except Exception as e:
+            logging.debug(f"Clipboard attempt {attempt+1} failed: {str(e)}")
+            time.sleep(0.05)
+    # Last resort before typing: pyperclip's own backend
+    try:
+        pyperclip.copy(text)
+        return pyperclip.paste().startswith(text[:100])
+    except Exception as e:
+        logging.debug(f"pyperclip fallback failed: {str(e)}")
+        return False
+
 def paste_narration_text():
     """Pastes the narration content into the focused text field."""
     try:
         file_path = get_latest_narration_file()
         if not file_path:
             raise FileNotFoundError("No valid narration file found")
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = json.load(f)
+        with open(file_path, 'rb') as f:
+            content = orjson.loads(f.read())
+        # The stdlib dump escapes non-ASCII as \uXXXX, so the pasted text is pure ASCII
+        # without losing characters (orjson would emit raw UTF-8 that then had to be dropped)
         text_to_paste = json.dumps(content['sections'], indent=2)
-        text_to_paste = re.sub(r'[^\x00-\x7F]+', '', text_to_paste)
-        pyperclip.copy(text_to_paste)
-        time.sleep(0.5)
-        pyautogui.hotkey('ctrl', 'v')
-        time.sleep(1)
-        if not pyperclip.paste().startswith(text_to_paste[:100]):
+        if _set_clipboard(text_to_paste):
+            pyautogui.hotkey('ctrl', 'v')
+            time.sleep(1)
+        else:
             logging.warning("Clipboard paste failed, using direct typing")
-            send_keys(text_to_paste, pause=0)
+            # Type in chunks so the target's input buffer can keep up
+            for start in range(0, len(text_to_paste), TYPE_CHUNK_SIZE):
+                send_keys(text_to_paste[start:start + TYPE_CHUNK_SIZE], pause=0)
+                time.sleep(0.05)
         return True
     except Exception as e:
         logging.error(f"Paste failed: {str(e)}")
         logging.error(traceback.format_exc())
         return False
 
-def click_insert_prompt_button():
+def click_insert_prompt_button(region=None):
     """Click the insert prompt button using pyautogui image recognition."""
     logging.debug("Attempting to click insert prompt button via image recognition")
     try:
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        parent_dir = os.path.dirname(current_dir)
-        image_path = os.path.join(parent_dir, "data", "pyautogui_image_files", "insert_prompt_image.png")
-        if not os.path.exists(image_path):
-            raise FileNotFoundError(f"Insert prompt image missing at {image_path}")
+        image_path = _IMG["insert_prompt"]
         timeout = 15
         confidence = 0.9
-        start_time = time.time()
-        button_location = None
-        while time.time() - start_time < timeout:
-            button_location = pyautogui.locateCenterOnScreen(image_path, confidence=confidence, grayscale=True)
-            if button_location:
-                break
-            time.sleep(0.3)
+        button_location = poll_until(lambda: locate(image_path, confidence=confidence, region=region), timeout)
         if not button_location:
             raise Exception("Could not locate insert prompt button image")
         logging.info(f"Found insert prompt button at {button_location}")
-        pyautogui.moveTo(button_location, duration=0.3)
-        time.sleep(0.2)
-        pyautogui.click()
-        time.sleep(2)
+        _click(button_location)
         return True
     except Exception as e:
         logging.error(f"Insert prompt button click failed: {str(e)}")
         logging.error(traceback.format_exc())
         return False
 
-def wait_for_play_button():
+def wait_for_play_button(region=None):
     """Wait until the play button becomes visible."""
     logging.debug("Starting play button wait")
     try:
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        parent_dir = os.path.dirname(current_dir)
-        play_image_path = os.path.join(parent_dir, "data", "pyautogui_image_files", "play_button.png")
-        if not os.path.exists(play_image_path):
-            raise FileNotFoundError(f"Play button image missing at {play_image_path}")
+        play_image_path = _IMG["play_button"]
         timeout = 300  # 5 minutes
         confidence = 0.6
-        start_time = time.time()
+        last_digest = None
+
+        def _poll():
+            nonlocal last_digest
+            location, last_digest = locate_if_changed(
+                play_image_path, confidence=confidence, region=region, last_digest=last_digest
+            )
+            return location
+
         logging.info("Waiting for play button to appear...")
-        while time.time() - start_time < timeout:
-            play_location = pyautogui.locateCenterOnScreen(play_image_path, confidence=confidence, grayscale=True)
-            if play_location:
-                logging.info("Play button detected - processing complete")
-                return True
-            time.sleep(10)
+        # Unchanged frames skip the match, so polling every second stays cheap
+        if poll_until(_poll, timeout, interval=1):
+            logging.info("Play button detected - processing complete")
+            return True
         logging.error("Play button not found within 5 minutes")
         return False
     except Exception as e:
@@ -315,77 +392,82 @@ def wait_for_play_button():
         logging.error(traceback.format_exc())
         return False
 
-def click_three_dots_menu(check_only=False):
+def click_three_dots_menu_uia(app):
+    """
+    Click the audio overview's 'More options' button through the UIA tree: no screen
+    grab, no template match. Returns False (caller falls back to the image search)
+    if the button is missing or ambiguous.
+    """
+    try:
+        buttons = [
+            button for button in app.top_window().descendants(control_type="Button")
+            if button.window_text().strip().lower() in _MORE_OPTIONS_NAMES
+        ]
+        if len(buttons) != 1:
+            logging.info(f"UIA found {len(buttons)} 'More options' buttons; using image search")
+            return False
+        logging.info("Found three dots menu via UIA")
+        buttons[0].click_input()
+        time.sleep(1)
+        return True
+    except Exception as e:
+        logging.warning(f"UIA three dots lookup failed, using image search: {str(e)}")
+        return False
+
+def click_three_dots_menu(check_only=False, region=None):
     """Click the three dots menu using image recognition with indefinite waiting."""
     try:
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        image_path = os.path.join(os.path.dirname(current_dir), "data", "pyautogui_image_files", "three_dots_image.png")
-        if not os.path.exists(image_path):
-            raise FileNotFoundError(f"Three dots image missing at {image_path}")
+        image_path = _IMG["three_dots"]
         confidence = 0.7
-        grayscale = True
         attempt_count = 0
-        logging.info("Starting three dots detection (indefinite mode)")
-        while True:
+        last_digest = None
+
+        def _poll():
+            nonlocal attempt_count, last_digest
+            attempt_count += 1
             try:
-                attempt_count += 1
-                button_location = pyautogui.locateCenterOnScreen(image_path, confidence=confidence, grayscale=grayscale)
-                if button_location:
-                    logging.info(f"Found three dots at {button_location} (attempt {attempt_count})")
-                    if check_only:
-                        return True
-                    pyautogui.moveTo(button_location.x, button_location.y, duration=0.8)
-                    time.sleep(0.3)
-                    pyautogui.click()
-                    time.sleep(1)
-                    return True
-                wait_time = min(attempt_count * 0.3, 5)
-                time.sleep(wait_time)
+                location, last_digest = locate_if_changed(
+                    image_path, confidence=confidence, region=region, last_digest=last_digest
+                )
+                return location
             except Exception as e:
                 logging.warning(f"Detection attempt {attempt_count} failed: {str(e)}")
-                time.sleep(2)
+                return None
+
+        logging.info("Starting three dots detection (indefinite mode)")
+        # No timeout; back off linearly up to 5s between attempts
+        button_location = poll_until(_poll, timeout=None, interval=lambda attempt: min(attempt * 0.3, 5))
+        logging.info(f"Found three dots at {button_location} (attempt {attempt_count})")
+        if check_only:
+            return True
+        _click(button_location, duration=0.8)
+        time.sleep(1)
+        return True
     except Exception as e:
         logging.error(f"Three dots menu fatal error: {str(e)}")
         logging.error(traceback.format_exc())
         return False
 
-def click_download_button():
+def click_download_button(region=None):
     """
-    Wait one second after the three dots are clicked, then search for the download image
-    and click its center.
+    After the three dots menu opens, search for any download icon variant
+    (download_image*.png, e.g. light and dark theme) and click the first match.
     """
     logging.debug("Attempting to click 'Download' button via image recognition")
     try:
-        absolute_path = r"M:\ReactProjects\AutoNews\auto-news-channel\src\data\pyautogui_image_files\download_image.png"
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        parent_dir = os.path.dirname(current_dir)
-        relative_path = os.path.join(parent_dir, "data", "pyautogui_image_files", "download_image.png")
-        potential_paths = [absolute_path, relative_path]
-        image_path = None
-        for path in potential_paths:
-            logging.debug(f"Checking for download image at: {path}")
-            if os.path.exists(path):
-                image_path = path
-                logging.info(f"Found download image at: {path}")
-                break
-        if not image_path:
-            raise FileNotFoundError(f"Download image not found. Checked paths: {potential_paths}")
-        time.sleep(1)
         timeout = 15
         confidence = 0.8
-        start_time = time.time()
-        button_location = None
-        while time.time() - start_time < timeout:
-            button_location = pyautogui.locateCenterOnScreen(image_path, confidence=confidence, grayscale=True)
-            if button_location:
-                break
-            time.sleep(0.3)
+
+        def _poll():
+            # One grab per poll, matched against every variant
+            found = locate_many(_DOWNLOAD_VARIANTS, region=region, confidence=confidence)
+            return next((loc for loc in found.values() if loc), None)
+
+        button_location = poll_until(_poll, timeout)
         if not button_location:
             raise Exception("Could not locate the 'Download' button image on screen")
         logging.info(f"Found download button at {button_location}")
-        pyautogui.moveTo(button_location, duration=0.3)
-        time.sleep(0.2)
-        pyautogui.click()
+        _click(button_location)
         time.sleep(1)
         return True
     except Exception as e:
@@ -412,6 +494,7 @@ def configure_chrome_download_settings(app):
         time.sleep(2)  # Allow Chrome to open
         chrome_window = app.top_window()
         chrome_window.set_focus()
+        region = _window_region(app)
         time.sleep(0.5)
         send_keys("%d", pause=0)  # Alt+D to focus the address bar
         send_keys("chrome://settings/downloads{ENTER}", pause=0)
@@ -419,30 +502,25 @@ def configure_chrome_download_settings(app):
         time.sleep(1)
         
         # Search for "Change Download Location" button
-        change_image_path = r"M:\ReactProjects\AutoNews\auto-news-channel\src\data\pyautogui_image_files\change_download_location_image.png"
-        if not os.path.exists(change_image_path):
-            raise FileNotFoundError(f"Change location image not found at: {change_image_path}")
+        change_image_path = _IMG["change_location"]
         
         thresholds = [0.9, 0.85, 0.8, 0.75, 0.7, 0.65]  # Extended to lower threshold 0.65
-        button_location = None
-        start_time = time.time()
         timeout = 10
-        while time.time() - start_time < timeout and button_location is None:
-            for conf in thresholds:
-                try:
-                    button_location = pyautogui.locateCenterOnScreen(change_image_path, confidence=conf, grayscale=True)
-                except pyautogui.ImageNotFoundException:
-                    button_location = None
-                if button_location:
-                    logging.info(f"Found 'Change Download Location' button at {button_location} with confidence {conf}")
-                    break
-            if button_location:
-                break
-            time.sleep(0.3)
-        if not button_location:
+
+        def _poll():
+            # One grab and one match give the best score; bucket it into the threshold tiers
+            location, score = locate_scored(
+                grab_gray(region), change_image_path, confidence=thresholds[-1], region=region
+            )
+            return (location, score) if location else None
+
+        found = poll_until(_poll, timeout)
+        if not found:
             raise Exception("Could not locate the 'Change Download Location' button image.")
-        pyautogui.moveTo(button_location, duration=0.3)
-        pyautogui.click()
+        button_location, score = found
+        conf = next(t for t in thresholds if score >= t)
+        logging.info(f"Found 'Change Download Location' button at {button_location} with confidence {conf} (score {score:.2f})")
+        _click(button_location)
         
         time.sleep(2)  # Wait for file dialog
         
@@ -453,24 +531,13 @@ def configure_chrome_download_settings(app):
         logging.info(f"Typed folder path: {folder_path}")
         
         time.sleep(0.5)
-        select_image_path = r"M:\ReactProjects\AutoNews\auto-news-channel\src\data\pyautogui_image_files\select_folder.png"
-        if not os.path.exists(select_image_path):
-            raise FileNotFoundError(f"Select folder image not found at: {select_image_path}")
-        start_time = time.time()
-        select_button_location = None
-        while time.time() - start_time < timeout and select_button_location is None:
-            try:
-                select_button_location = pyautogui.locateCenterOnScreen(select_image_path, confidence=0.8, grayscale=True)
-            except pyautogui.ImageNotFoundException:
-                select_button_location = None
-            if select_button_location:
-                break
-            time.sleep(0.3)
+        select_image_path = _IMG["select_folder"]
+        # The folder picker is a separate dialog, so search the whole screen
+        select_button_location = poll_until(lambda: locate(select_image_path, confidence=0.8), timeout)
         if not select_button_location:
             raise Exception("Could not locate the 'Select Folder' image.")
         logging.info(f"Found 'Select Folder' button at {select_button_location}")
-        pyautogui.moveTo(select_button_location, duration=0.3)
-        pyautogui.click()
+        _click(select_button_location)
         time.sleep(1)
         
         logging.info("Chrome download settings configured successfully.")
@@ -501,31 +568,19 @@ def navigate_to_download_settings(app):
         logging.error(traceback.format_exc())
         return None
 
-def click_change_button():
+def click_change_button(region=None):
     """
     Locate and click the 'Change location' button in the Downloads settings using pyautogui.
     """
     logging.debug("Attempting to click the 'Change location' button using pyautogui image recognition.")
     try:
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        parent_dir = os.path.dirname(current_dir)
-        image_path = os.path.join(parent_dir, "data", "pyautogui_image_files", "change_download_location_image.png")
-        logging.debug(f"Looking for change location button at: {image_path}")
-        if not os.path.exists(image_path):
-            raise FileNotFoundError(f"Image file missing at: {image_path}")
+        image_path = _IMG["change_location"]
         timeout = 10
-        start_time = time.time()
-        button_location = None
-        while time.time() - start_time < timeout:
-            button_location = pyautogui.locateCenterOnScreen(image_path, confidence=0.9)
-            if button_location:
-                break
-            time.sleep(0.3)
+        button_location = poll_until(lambda: locate_center(image_path, confidence=0.9, grayscale=False, region=region), timeout)
         if not button_location:
             raise Exception("Could not locate the 'Change location' button image on screen.")
         logging.info(f"Found 'Change location' button image at {button_location}.")
-        pyautogui.moveTo(button_location)
-        pyautogui.click(button_location)
+        _click(button_location)
         time.sleep(1)
         logging.info("Change dialog activated successfully using pyautogui.")
         return True
@@ -552,30 +607,18 @@ def set_download_path():
         logging.error(traceback.format_exc())
         return False
 
-def click_generate_podcast_button():
+def click_generate_podcast_button(region=None):
     """Click the 'Generate Podcast' button using pyautogui image recognition."""
     logging.debug("Attempting to click 'Generate Podcast' button via image recognition")
     try:
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        parent_dir = os.path.dirname(current_dir)
-        image_path = os.path.join(parent_dir, "data", "pyautogui_image_files", "generate_podcast_image.png")
-        if not os.path.exists(image_path):
-            raise FileNotFoundError(f"Generate podcast image missing at {image_path}")
+        image_path = _IMG["generate_podcast"]
         timeout = 20
         confidence = 0.8
-        start_time = time.time()
-        button_location = None
-        while time.time() - start_time < timeout:
-            button_location = pyautogui.locateCenterOnScreen(image_path, confidence=confidence, grayscale=True)
-            if button_location:
-                break
-            time.sleep(0.3)
+        button_location = poll_until(lambda: locate(image_path, confidence=confidence, region=region), timeout)
         if not button_location:
             raise Exception("Could not locate 'Generate Podcast' button image")
         logging.info(f"Found generate podcast button at {button_location}")
-        pyautogui.moveTo(button_location, duration=0.3)
-        time.sleep(0.2)
-        pyautogui.click()
+        _click(button_location)
         time.sleep(1)
         return True
     except Exception as e:
@@ -589,6 +632,15 @@ def click_generate_podcast_button():
 
 def main():
     logging.debug("Starting the automated browser process.")
+    try:
+        _validate_images()
+    except FileNotFoundError as e:
+        logging.error(str(e))
+        return
+    # Decode templates on a worker while the browser starts
+    executor = ThreadPoolExecutor(max_workers=1)
+    preload_future = executor.submit(_preload_templates)
+    executor.shutdown(wait=False)
     print("Select Browser:")
     print("1: Microsoft Edge")
     print("2: Google Chrome")
@@ -603,7 +655,7 @@ def main():
         if app:
             edge_window = navigate_to_download_settings(app)
             if edge_window:
-                if click_change_button():
+                if click_change_button(region=_window_region(app)):
                     path_result = set_download_path()
                     logging.info(f"Download path set result: {path_result}")
                 else:
@@ -628,28 +680,27 @@ def main():
         return
 
     if app:
+        try:
+            preload_future.result()
+        except Exception as e:
+            logging.warning(f"Template preload failed, templates will load on first use: {str(e)}")
         notebook_url = "https://notebooklm.google.com/"
         if navigate_to_notebook(app, notebook_url):
-            time.sleep(3)
-            click_create_new_button()
-            time.sleep(1.5)
-            click_copy_text_button()
-            time.sleep(1)
-            click_text_here_asterisk()
-            time.sleep(2)
+            # Restrict every image search to the browser window
+            region = _window_region(app)
+            # Every step polls for its own target, so no fixed sleeps between steps
+            click_sequence([("create_new", 0.7), ("copy_text", 0.9), ("text_here", 0.7)], region=region)
+            time.sleep(0.5)  # Let the text area take focus before pasting
             paste_narration_text()
-            time.sleep(1)
-            click_insert_prompt_button()
-            time.sleep(2)
-            click_generate_podcast_button()
-            time.sleep(3)
-            if wait_for_play_button():
-                time.sleep(10)
+            if click_insert_prompt_button(region=region):
+                # The prompt button disappearing means the dialog accepted the text
+                wait_until_gone("insert_prompt", region=region, timeout=5)
+            click_generate_podcast_button(region=region)
+            if wait_for_play_button(region=region):
                 app.top_window().set_focus()
-                time.sleep(1)
-                if click_three_dots_menu():
+                if click_three_dots_menu_uia(app) or click_three_dots_menu(region=region):
                     logging.info("Successfully opened context menu")
-                    if click_download_button():
+                    if click_download_button(region=region):
                         logging.info("Download button clicked successfully")
                     else:
                         logging.error("Failed to click download button")
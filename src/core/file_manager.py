@@ -1,15 +1,31 @@
+import atexit
+import os
+import shutil
 import tempfile
+import uuid
 import logging
 from contextlib import contextmanager
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+_session_dir = None
+
+def _get_session_dir() -> str:
+    """One private temp directory per process; unique names inside it need no collision retries."""
+    global _session_dir
+    if _session_dir is None:
+        _session_dir = tempfile.mkdtemp(prefix="veritas_")
+        atexit.register(shutil.rmtree, _session_dir, ignore_errors=True)
+    return _session_dir
+
 @contextmanager
 def managed_tempfile(prefix: str = "tmp"):
     path = None
     try:
-        fd, path = tempfile.mkstemp(prefix=prefix)
+        path = os.path.join(_get_session_dir(), f"{prefix}{uuid.uuid4().hex}")
+        # Create the file like mkstemp does, but close the descriptor right away
+        os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600))
         yield Path(path)
     except Exception as e:
         logger.error(f"Temp file error: {str(e)}")
@@ -17,6 +33,8 @@ def managed_tempfile(prefix: str = "tmp"):
     finally:
         if path:
             try:
-                Path(path).unlink(missing_ok=True)
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
             except Exception as e:
-                logger.warning(f"Failed to clean {path}: {str(e)}") 
\ No newline at end of file
+                logger.warning(f"Failed to clean {path}: {str(e)}")
@@ -0,0 +1,113 @@
+import cv2
+import functools
+import numpy as np
+import zlib
+from typing import Dict, Optional, Tuple
+
+from core.screen import grab, load_template, monitor_rect
+
+PYRAMID_LEVELS = 3       # Full resolution plus two pyrDown levels
+MIN_TEMPLATE_SIDE = 12   # Stop shrinking before a template loses its features
+COARSE_SLACK = 0.1       # Coarse levels score lower; accept candidates this far below confidence
+REFINE_MARGIN = {1: 8, 0: 4}  # Search window (px) around the candidate at each finer level
+
+@functools.lru_cache(maxsize=64)
+def _build_pyramid(path: str) -> Tuple[np.ndarray, ...]:
+    pyramid = [load_template(path, grayscale=True)]
+    while len(pyramid) < PYRAMID_LEVELS and min(pyramid[-1].shape[:2]) // 2 >= MIN_TEMPLATE_SIDE:
+        pyramid.append(cv2.pyrDown(pyramid[-1]))
+    return tuple(pyramid)
+
+def _template_pyramid(image_path) -> Tuple[np.ndarray, ...]:
+    """Grayscale template at full, 1/2 and 1/4 scale, built once per path."""
+    return _build_pyramid(str(image_path))
+
+def preload(image_paths):
+    """Decode templates and build their pyramids ahead of time (safe to run on a worker thread)."""
+    for path in image_paths:
+        _template_pyramid(path)
+
+def _best_match(haystack, template) -> Tuple[float, Tuple[int, int]]:
+    if haystack.shape[0] < template.shape[0] or haystack.shape[1] < template.shape[1]:
+        return -1.0, (0, 0)
+    res = cv2.matchTemplate(haystack, template, cv2.TM_CCOEFF_NORMED)
+    _, max_val, _, max_loc = cv2.minMaxLoc(res)
+    return max_val, max_loc
+
+def match_pyramid(haystack, pyramid, confidence) -> Tuple[Optional[Tuple[int, int]], float]:
+    """
+    Coarse-to-fine search of a grayscale haystack: match the smallest level over
+    the whole image, then re-match only a small window around the candidate at
+    each finer level. Returns (top-left corner at full scale or None, best score).
+    """
+    levels = [haystack]
+    for _ in range(len(pyramid) - 1):
+        levels.append(cv2.pyrDown(levels[-1]))
+
+    top = len(pyramid) - 1
+    score, (x, y) = _best_match(levels[top], pyramid[top])
+    threshold = confidence if top == 0 else confidence - COARSE_SLACK
+    if score < threshold:
+        return None, score
+
+    for level in range(top - 1, -1, -1):
+        margin = REFINE_MARGIN.get(level, 4)
+        th, tw = pyramid[level].shape[:2]
+        x0, y0 = max(x * 2 - margin, 0), max(y * 2 - margin, 0)
+        window = levels[level][y0:y * 2 + th + margin, x0:x * 2 + tw + margin]
+        score, (dx, dy) = _best_match(window, pyramid[level])
+        x, y = x0 + dx, y0 + dy
+
+    return ((x, y) if score >= confidence else None), score
+
+def grab_gray(region=None) -> np.ndarray:
+    return cv2.cvtColor(grab(region), cv2.COLOR_BGR2GRAY)
+
+def locate_scored(haystack, image_path, confidence=0.8, region=None) -> Tuple[Optional[Tuple[int, int]], float]:
+    """
+    Screen (x, y) center of `image_path` in a grayscale frame grabbed from `region`,
+    plus the match score. One matchTemplate pass yields the best score, so callers
+    with several acceptable confidence tiers pass the lowest and bucket the score.
+    """
+    pyramid = _template_pyramid(image_path)
+    monitor = monitor_rect(region)
+    corner, score = match_pyramid(haystack, pyramid, confidence)
+    if corner is None:
+        return None, score
+    th, tw = pyramid[0].shape[:2]
+    return (monitor['left'] + corner[0] + tw // 2, monitor['top'] + corner[1] + th // 2), score
+
+def locate_in(haystack, image_path, confidence=0.8, region=None) -> Optional[Tuple[int, int]]:
+    """Screen (x, y) center of `image_path` in a grayscale frame grabbed from `region`."""
+    return locate_scored(haystack, image_path, confidence, region)[0]
+
+def locate(image_path, confidence=0.8, region=None) -> Optional[Tuple[int, int]]:
+    """Screen (x, y) center of `image_path` within `region`, or None if not found."""
+    return locate_in(grab_gray(region), image_path, confidence, region)
+
+def locate_if_changed(image_path, confidence=0.8, region=None,
+                      last_digest=None) -> Tuple[Optional[Tuple[int, int]], int]:
+    """
+    Like locate(), for polling loops: returns (location, frame digest) and skips
+    the template match entirely when the frame is identical to the one that
+    produced `last_digest`.
+    """
+    haystack = grab_gray(region)
+    digest = zlib.crc32(haystack)
+    if digest == last_digest:
+        return None, digest
+    return locate_in(haystack, image_path, confidence, region), digest
+
+def locate_many(templates: Dict[str, str], region=None, confidence=0.8,
+                confidences: Optional[Dict[str, float]] = None) -> Dict[str, Optional[Tuple[int, int]]]:
+    """
+    Grab `region` once and match every template against that same frame.
+    Returns name -> screen (x, y) center, or None for templates not found.
+    `confidences` overrides the default `confidence` per name.
+    """
+    haystack = grab_gray(region)
+    confidences = confidences or {}
+    return {
+        name: locate_in(haystack, path, confidences.get(name, confidence), region)
+        for name, path in templates.items()
+    }
@@ -7,18 +7,33 @@ class Monitoring:
         self.ERRORS = Counter('api_errors', 'API errors', ['service', 'type'])
         self.LATENCY = Histogram('request_latency', 'API latency', ['service'])
         self.QUEUE_SIZE = Gauge('task_queue_size', 'Pending tasks in queue')
+        # Bound children per label tuple; services and error types are a small, fixed set
+        self._req = {}
+        self._err = {}
+        self._lat = {}
         
     def start(self):
         start_http_server(self.port)
         
     def track_request(self, service: str, success: bool):
-        self.REQUESTS.labels(service, "success" if success else "failure").inc()
+        key = (service, "success" if success else "failure")
+        m = self._req.get(key)
+        if m is None:
+            m = self._req[key] = self.REQUESTS.labels(*key)
+        m.inc()
         
     def track_error(self, service: str, error_type: str):
-        self.ERRORS.labels(service, error_type).inc()
+        key = (service, error_type)
+        m = self._err.get(key)
+        if m is None:
+            m = self._err[key] = self.ERRORS.labels(*key)
+        m.inc()
         
     def track_latency(self, service: str, duration: float):
-        self.LATENCY.labels(service).observe(duration)
+        m = self._lat.get(service)
+        if m is None:
+            m = self._lat[service] = self.LATENCY.labels(service)
+        m.observe(duration)
         
     def update_queue_size(self, size: int):
         self.QUEUE_SIZE.set(size) 
\ No newline at end of file
@@ -1,26 +1,109 @@
 import os
-import json
+import calendar
+from array import array
+import functools
+from collections import OrderedDict
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import List, Dict, Optional, Tuple
 import feedparser
+import numpy as np
+import orjson
 from gnews import GNews
 import hashlib
 import pytz
 import time
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 
 import praw
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 from dateutil import parser
 import ollama
 from ollama import Client
+from pybloom_live import ScalableBloomFilter
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.DEBUG)  # Ensure debug logs are captured
 
+RANK_CHUNK_SIZE = 10  # Stories per ranking call
+RANK_TOKENS_PER_STORY = 256  # Output token budget per story in a ranking call
+_NO_RANKING = {"importance": 0, "entertainment": 0, "combined": 0, "reasoning": "No ranking data"}
+
+HASH_LOG_COMPACT_AT = 50_000  # Log entries before folding them into the Bloom snapshot
+RECENT_HASHES_MAX = 1000  # Exact recent-window check in front of the Bloom filter
+
+# Local pre-ranking weights; only the top candidates are sent to the LLM
+PREFILTER_KEEP = 30
+PREFILTER_W_RECENCY = 1.0
+PREFILTER_W_SOURCE = 0.5
+PREFILTER_W_LENGTH = 0.5
+PREFILTER_HALF_LIFE_HOURS = 12
+
+RANKING_PROMPT = """We have {count} news stories. For each story, assign:
+- Importance score (0-10)
+- Entertainment score (0-10)
+- Combined rating (0-100)
+
+Provide a short reasoning for each assignment.
+
+Respond with JSON only, EXACTLY in this shape, one entry per story:
+{{"rankings": [{{"idx": 1, "importance": 0, "entertainment": 0, "combined": 0, "reasoning": "..."}}]}}
+
+"""
+
+PARSE_CACHE_SIZE = 16384
+_NUMERIC_RE = re.compile(r'\d+(?:\.\d+)?')  # Used with fullmatch
+
+def _to_epoch(dt: datetime) -> float:
+    if not dt.tzinfo:
+        dt = dt.replace(tzinfo=pytz.utc)
+    return dt.timestamp()
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _hash_story(title: str, link: str) -> int:
+    """
+    64-bit hash of a story's normalized title and link.
+    Cached because Reddit and GNews re-serve the same stories on every refresh.
+    """
+    # Title + link identifies a story; hashing the long description only costs time
+    combo = f"{title.lower().strip()}\x1f{link.lower().strip()}"
+    # 8 bytes is plenty for dedup at this scale, and blake2b beats sha256 on short inputs
+    return int.from_bytes(hashlib.blake2b(combo.encode('utf-8'), digest_size=8).digest(), 'little')
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_epoch(datestr: str) -> Optional[float]:
+    """
+    Parse a date string into POSIX seconds, treating naive times as UTC.
+    Tries the stdlib ISO-8601 and RFC-2822 parsers, which cover nearly every
+    feed, before dateutil's much slower general parser.
+    Cached because feeds re-publish the same timestamp strings across fetches.
+    """
+    if not datestr:
+        return None
+    if _NUMERIC_RE.fullmatch(datestr):
+        return float(datestr)
+    try:
+        return _to_epoch(datetime.fromisoformat(datestr.replace('Z', '+00:00')))
+    except ValueError:
+        pass
+    try:
+        return _to_epoch(parsedate_to_datetime(datestr))
+    except (TypeError, ValueError, IndexError):
+        pass
+    try:
+        return _to_epoch(parser.parse(datestr))
+    except Exception as e:
+        logger.debug(f"Failed to parse date '{datestr}': {e}")
+        return None
+
 class NewsAggregator:
     """
     Aggregates news from Google News, RSS feeds, and Reddit.
@@ -51,20 +134,49 @@ class NewsAggregator:
             max_results=self.max_results
         )
 
-        self.seen_hashes = set()
+        # Pooled HTTP session shared by the RSS download workers and the Reddit client,
+        # so recurring hosts reuse warm TLS connections; transient errors retry with backoff
+        self.http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+        )
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
+
+        # Bloom filter of item hashes: ~1.4 bytes per item at a 0.1% false-positive rate,
+        # and it grows on its own, so no trimming is needed
+        self.seen_hashes = ScalableBloomFilter(initial_capacity=100_000, error_rate=0.001)
+        # Most repeats are items seen in the last few fetches; an exact, bounded
+        # window answers those without hashing through the Bloom filter
+        self._recent_hashes: "OrderedDict[int, None]" = OrderedDict()
+        # Hashes added this run, appended to the hash log on save
+        self._new_hashes = array('Q')
+        self._log_entries = 0
         self.utc_timezone = pytz.utc
         self._load_seen_hashes()
 
+        # feed url -> (ETag, Last-Modified) for conditional GETs, stored beside the hash file
+        hash_file = self.config.get('hash_file', './data/seen_hashes.json')
+        self._feed_meta_file = os.path.join(os.path.dirname(hash_file), 'feed_meta.json')
+        self._feed_meta: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        self._load_feed_meta()
+
         # Reddit
         reddit_id = os.getenv("REDDIT_CLIENT_ID")
         reddit_secret = os.getenv("REDDIT_CLIENT_SECRET")
+        # praw.Reddit is not thread-safe (rate limiter, token refresh, session), so the
+        # listing workers each build their own from these kwargs (see _thread_reddit)
+        self._reddit_kwargs = {
+            'client_id': reddit_id,
+            'client_secret': reddit_secret,
+            'user_agent': config.get('reddit_user_agent', 'AutoNewsChannel/2.0')
+        }
+        self._reddit_local = threading.local()
         if reddit_id and reddit_secret:
             try:
-                self.reddit = praw.Reddit(
-                    client_id=reddit_id,
-                    client_secret=reddit_secret,
-                    user_agent=config.get('reddit_user_agent', 'AutoNewsChannel/2.0')
-                )
+                self.reddit = praw.Reddit(**self._reddit_kwargs, requestor_kwargs={'session': self.http})
                 logger.info("Reddit client initialized.")
             except Exception as e:
                 logger.warning(f"Could not initialize Reddit client: {e}")
@@ -73,95 +185,145 @@ class NewsAggregator:
             logger.info("Reddit credentials not found in environment. Skipping Reddit fetch.")
             self.reddit = None
 
+        # Source name -> weight for the local pre-ranking, 1.0 when unlisted
+        self.source_weights = config.get('source_weights', {})
+
         # DeepSeek local model for picking top stories
         self.deepseek_client = Client()
         self.deepseek_model = config.get('deepseek_model', 'deepseek-r1')
+        # Ranking is a short structured task; a small instruct model does it several
+        # times faster than the reasoning model, which is kept behind a flag
+        if config.get('use_reasoning_model', False):
+            self.ranking_model = self.deepseek_model
+        else:
+            self.ranking_model = config.get('ranking_model', 'qwen2.5:7b-instruct')
 
-    def _load_seen_hashes(self):
-        """Load previously saved news hashes to skip duplicates."""
+    def _bloom_file(self) -> str:
         hash_file = self.config.get('hash_file', './data/seen_hashes.json')
+        return os.path.splitext(hash_file)[0] + '.bloom'
+
+    def _hash_log_file(self) -> str:
+        return os.path.splitext(self._bloom_file())[0] + '.log'
+
+    def _load_seen_hashes(self):
+        """
+        Load previously saved news hashes to skip duplicates: the Bloom snapshot
+        from the last compaction, then every hash appended to the log since.
+        """
         try:
-            with open(hash_file, 'r', encoding='utf-8') as f:
-                self.seen_hashes = set(json.load(f))
-            logger.info(f"Loaded {len(self.seen_hashes)} seen hashes.")
-        except (FileNotFoundError, json.JSONDecodeError):
-            logger.info("No existing seen_hashes found. Starting fresh.")
+            with open(self._bloom_file(), 'rb') as f:
+                self.seen_hashes = ScalableBloomFilter.fromfile(f)
+        except FileNotFoundError:
+            logger.info("No existing seen_hashes snapshot found. Starting fresh.")
         except Exception as e:
             logger.error(f"Error loading seen hashes: {e}")
-
-    def _save_seen_hashes(self):
-        """Save updated seen hashes after aggregation completes."""
-        hash_file = self.config.get('hash_file', './data/seen_hashes.json')
         try:
-            os.makedirs(os.path.dirname(hash_file), exist_ok=True)
-            with open(hash_file, 'w', encoding='utf-8') as f:
-                json.dump(list(self.seen_hashes), f, indent=2)
-            logger.info(f"Saved {len(self.seen_hashes)} seen hashes.")
+            log_file = self._hash_log_file()
+            entries = os.path.getsize(log_file) // 8
+            logged = array('Q')
+            with open(log_file, 'rb') as f:
+                logged.fromfile(f, entries)
+            for h in logged:
+                self.seen_hashes.add(h)
+            self._log_entries = entries
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Error replaying seen hashes log: {e}")
+        logger.info(f"Loaded {len(self.seen_hashes)} seen hashes.")
 
-            # Manage the size of seen_hashes to prevent excessive growth
-            self._manage_seen_hashes(max_size=1000)
+    def _load_feed_meta(self):
+        """Load the ETag/Last-Modified validators saved by the previous run."""
+        try:
+            with open(self._feed_meta_file, 'rb') as f:
+                self._feed_meta = {url: tuple(meta) for url, meta in orjson.loads(f.read()).items()}
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            pass
+        except Exception as e:
+            logger.error(f"Error loading feed metadata: {e}")
 
+    def _save_feed_meta(self):
+        try:
+            os.makedirs(os.path.dirname(self._feed_meta_file) or '.', exist_ok=True)
+            with open(self._feed_meta_file, 'wb') as f:
+                f.write(orjson.dumps(self._feed_meta, option=orjson.OPT_APPEND_NEWLINE))
         except Exception as e:
-            logger.error(f"Error saving seen hashes: {e}")
+            logger.error(f"Error saving feed metadata: {e}")
 
-    def _manage_seen_hashes(self, max_size: int = 1000):
+    def _save_seen_hashes(self):
         """
-        Ensures that the seen_hashes set does not exceed max_size.
-        Removes the oldest hashes if necessary.
+        Append this run's new hashes to the log (8 bytes each) instead of
+        rewriting the whole filter; compact into a fresh snapshot once the log grows.
         """
-        if len(self.seen_hashes) > max_size:
-            # Convert set to list to remove the oldest entries
-            seen_list = list(self.seen_hashes)
-            # Remove the oldest entries
-            seen_list = seen_list[-max_size:]
-            self.seen_hashes = set(seen_list)
-            logger.info(f"Managed seen_hashes to contain only the latest {max_size} entries.")
-
-    def _parse_datetime(self, datestr: str) -> Optional[datetime]:
-        """Parse string into timezone-aware datetime object (UTC), or None if fails."""
+        log_file = self._hash_log_file()
         try:
-            if re.fullmatch(r'\d+(\.\d+)?', datestr):
-                dt = datetime.utcfromtimestamp(float(datestr)).replace(tzinfo=self.utc_timezone)
-            else:
-                dt = parser.parse(datestr)
-                if not dt.tzinfo:
-                    dt = dt.replace(tzinfo=self.utc_timezone)
-                dt = dt.astimezone(self.utc_timezone)
-            return dt
+            os.makedirs(os.path.dirname(log_file) or '.', exist_ok=True)
+            if self._new_hashes:
+                with open(log_file, 'ab') as f:
+                    self._new_hashes.tofile(f)
+                self._log_entries += len(self._new_hashes)
+                logger.info(f"Appended {len(self._new_hashes)} seen hashes.")
+                self._new_hashes = array('Q')
+            if self._log_entries >= HASH_LOG_COMPACT_AT:
+                self._compact_seen_hashes()
         except Exception as e:
-            logger.debug(f"Failed to parse date '{datestr}': {e}")
-            return None
+            logger.error(f"Error saving seen hashes: {e}")
 
-    def _hash_item(self, item: Dict) -> str:
-        """Generate a unique hash from title, description, and link."""
-        title = item.get('title', '').lower().strip()
-        desc = item.get('description', '').lower().strip()
-        link = item.get('link', '').lower().strip()
-        combo = f"{title} {desc} {link}"
-        return hashlib.sha256(combo.encode('utf-8')).hexdigest()
+    def _compact_seen_hashes(self):
+        """Write the full filter as the new snapshot and truncate the log."""
+        bloom_file = self._bloom_file()
+        tmp_file = bloom_file + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            self.seen_hashes.tofile(f)
+        os.replace(tmp_file, bloom_file)
+        # Only drop the log once the snapshot that covers it is in place
+        open(self._hash_log_file(), 'wb').close()
+        self._log_entries = 0
+        logger.info(f"Compacted {len(self.seen_hashes)} seen hashes into {bloom_file}")
+
+    def _parse_datetime(self, datestr: str) -> Optional[float]:
+        """Parse string into POSIX seconds (naive times are UTC), or None if fails."""
+        return _parse_epoch(datestr)
+
+    def _hash_item(self, item: Dict) -> int:
+        """Generate a unique 64-bit hash from title and link."""
+        return _hash_story(item.get('title', ''), item.get('link', ''))
+
+    def _remember_recent(self, c_hash: int):
+        self._recent_hashes[c_hash] = None
+        if len(self._recent_hashes) > RECENT_HASHES_MAX:
+            self._recent_hashes.popitem(last=False)
 
     def _filter_news(self, items: List[Dict]) -> List[Dict]:
         """Remove duplicates and items older than 'max_age_hours'."""
-        cutoff = datetime.now(tz=self.utc_timezone) - timedelta(hours=self.max_age_hours)
+        cutoff_ts = time.time() - self.max_age_hours * 3600
         filtered = []
-        old_count = 0
         duplicate_count = 0
-        missing_date_count = 0
 
-        for it in items:
-            pub_str = it.get('published date', '')
-            dt_obj = self._parse_datetime(pub_str)
-            if not dt_obj:
-                missing_date_count += 1
-                continue
-            if dt_obj < cutoff:
-                old_count += 1
-                continue
+        # Recency check over the whole batch at once; unparseable dates become NaN
+        pub_ts = np.fromiter(
+            (self._parse_datetime(it.get('published date', '')) or np.nan for it in items),
+            dtype=np.float64, count=len(items)
+        )
+        missing = np.isnan(pub_ts)
+        fresh = pub_ts >= cutoff_ts  # NaN compares False
+        missing_date_count = int(missing.sum())
+        old_count = len(items) - missing_date_count - int(fresh.sum())
+
+        # Dedup stays sequential: items must also be checked against earlier ones in this batch
+        for i in np.flatnonzero(fresh):
+            it = items[i]
             c_hash = self._hash_item(it)
+            if c_hash in self._recent_hashes:
+                self._recent_hashes.move_to_end(c_hash)
+                duplicate_count += 1
+                continue
             if c_hash in self.seen_hashes:
                 duplicate_count += 1
                 continue
             self.seen_hashes.add(c_hash)
+            self._new_hashes.append(c_hash)
+            self._remember_recent(c_hash)
             filtered.append(it)
 
         logger.info(f"Filtered news: {old_count} old, {duplicate_count} duplicates, {missing_date_count} missing dates.")
@@ -187,33 +349,84 @@ class NewsAggregator:
             logger.error(f"GNews fetch error: {e}")
             return []
 
+    def _download_feed(self, feed_url: str) -> Optional[bytes]:
+        """Download one feed body over the shared session; None if unchanged or on failure."""
+        headers = {'User-Agent': feedparser.USER_AGENT}
+        etag, modified = self._feed_meta.get(feed_url, (None, None))
+        if etag:
+            headers['If-None-Match'] = etag
+        if modified:
+            headers['If-Modified-Since'] = modified
+        try:
+            resp = self.http.get(feed_url, headers=headers, timeout=10)
+            if resp.status_code == 304:
+                logger.info(f"RSS feed not modified since last run: {feed_url}")
+                return None
+            resp.raise_for_status()
+            self._feed_meta[feed_url] = (resp.headers.get('ETag'), resp.headers.get('Last-Modified'))
+            return resp.content
+        except Exception as e:
+            logger.error(f"RSS fetch error for {feed_url}: {e}")
+            return None
+
     def fetch_rss_feeds(self) -> List[Dict]:
         """Fetch news from RSS feeds."""
         items = []
-        for feed_url in self.config.get('rss_feeds', []):
+        feeds = self.config.get('rss_feeds', [])
+        if not feeds:
+            return items
+        # Download all feeds in parallel, then parse them here in order
+        with ThreadPoolExecutor(max_workers=min(16, len(feeds))) as executor:
+            bodies = list(executor.map(self._download_feed, feeds))
+        self._save_feed_meta()
+        for feed_url, body in zip(feeds, bodies):
+            if body is None:
+                continue
             try:
-                fd = feedparser.parse(feed_url)
+                fd = feedparser.parse(body)
                 entry_count = 0
                 for entry in fd.entries:
-                    dt_str = entry.get('published') or entry.get('updated', '')
-                    dt_obj = self._parse_datetime(dt_str)
-                    if not dt_obj and hasattr(entry, 'published_parsed') and entry.published_parsed:
-                        dt_obj = datetime.fromtimestamp(time.mktime(entry.published_parsed), tz=self.utc_timezone)
-                    if not dt_obj and hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                        dt_obj = datetime.fromtimestamp(time.mktime(entry.updated_parsed), tz=self.utc_timezone)
-                    if not dt_obj:
+                    # feedparser's *_parsed fields are UTC struct_times; use them before
+                    # falling back to the string parser so undated entries never raise
+                    pp = entry.get('published_parsed') or entry.get('updated_parsed')
+                    if pp:
+                        ts = calendar.timegm(pp)
+                    else:
+                        ts = self._parse_datetime(entry.get('published') or entry.get('updated', ''))
+                    if ts is None:
                         continue
                     items.append({
                         'title': entry.get('title', ''),
                         'description': entry.get('description', ''),
                         'link': entry.get('link', ''),
-                        'published date': dt_obj.isoformat(),
+                        'published date': datetime.fromtimestamp(ts, tz=self.utc_timezone).isoformat(),
                         'source': feed_url
                     })
                     entry_count += 1
                 logger.info(f"Fetched {entry_count} entries from RSS feed: {feed_url}")
             except Exception as e:
-                logger.error(f"RSS fetch error for {feed_url}: {e}")
+                logger.error(f"RSS parse error for {feed_url}: {e}")
+        return items
+
+    def _thread_reddit(self) -> praw.Reddit:
+        """The calling worker thread's own Reddit client, created on first use."""
+        reddit = getattr(self._reddit_local, 'reddit', None)
+        if reddit is None:
+            reddit = self._reddit_local.reddit = praw.Reddit(**self._reddit_kwargs)
+        return reddit
+
+    def _fetch_subreddit(self, sub: str, limit: int) -> List[Dict]:
+        """Fetch the hot listing of one subreddit; runs on a worker thread."""
+        items = []
+        for post in self._thread_reddit().subreddit(sub).hot(limit=limit):
+            dt_obj = datetime.utcfromtimestamp(post.created_utc).replace(tzinfo=self.utc_timezone)
+            items.append({
+                'title': post.title,
+                'description': post.selftext,
+                'link': post.url,
+                'published date': dt_obj.isoformat(),
+                'source': f"reddit.com/r/{sub}"
+            })
         return items
 
     def fetch_reddit_news(self) -> List[Dict]:
@@ -221,25 +434,21 @@ class NewsAggregator:
         if not self.reddit:
             logger.info("Reddit client not initialized. Skipping Reddit fetch.")
             return []
+        subs = self.config.get('reddit_subreddits', [])
+        if not subs:
+            return []
+        limit = self.config.get('reddit_limit', 15)
         items = []
-        for sub in self.config.get('reddit_subreddits', []):
-            try:
-                limit = self.config.get('reddit_limit', 15)
-                submissions = self.reddit.subreddit(sub).hot(limit=limit)
-                cnt = 0
-                for post in submissions:
-                    dt_obj = datetime.utcfromtimestamp(post.created_utc).replace(tzinfo=self.utc_timezone)
-                    items.append({
-                        'title': post.title,
-                        'description': post.selftext,
-                        'link': post.url,
-                        'published date': dt_obj.isoformat(),
-                        'source': f"reddit.com/r/{sub}"
-                    })
-                    cnt += 1
-                logger.info(f"Fetched {cnt} posts from Reddit subreddit: r/{sub}")
-            except Exception as e:
-                logger.error(f"Reddit fetch error for r/{sub}: {e}")
+        # Subreddit listings are independent requests, so fetch them side by side
+        with ThreadPoolExecutor(max_workers=min(8, len(subs))) as executor:
+            futures = [(sub, executor.submit(self._fetch_subreddit, sub, limit)) for sub in subs]
+            for sub, future in futures:
+                try:
+                    posts = future.result()
+                    items.extend(posts)
+                    logger.info(f"Fetched {len(posts)} posts from Reddit subreddit: r/{sub}")
+                except Exception as e:
+                    logger.error(f"Reddit fetch error for r/{sub}: {e}")
         return items
 
     def aggregate_news(self) -> List[Dict]:
@@ -250,10 +459,16 @@ class NewsAggregator:
         4. Return the final list of news items.
         """
         logger.info("Starting news aggregation.")
-        all_gnews = self.fetch_gnews()
-        all_rss = self.fetch_rss_feeds()
-        all_reddit = self.fetch_reddit_news()
-        combined = all_gnews + all_rss + all_reddit
+        # The fetchers are network-bound and independent, so run them side by side
+        fetchers = [self.fetch_gnews, self.fetch_rss_feeds, self.fetch_reddit_news]
+        combined = []
+        with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+            futures = [(fetch.__name__, executor.submit(fetch)) for fetch in fetchers]
+            for name, future in futures:
+                try:
+                    combined.extend(future.result())
+                except Exception as e:
+                    logger.error(f"{name} failed: {e}")
         logger.info(f"Combined total {len(combined)} news items before filtering.")
         filtered = self._filter_news(combined)
         logger.info(f"{len(filtered)} news items remain after filtering.")
@@ -262,8 +477,8 @@ class NewsAggregator:
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         all_news_file = os.path.join(self.news_dir, f"all_news_{ts}.json")
         try:
-            with open(all_news_file, 'w', encoding='utf-8') as f:
-                json.dump(filtered, f, indent=2)
+            with open(all_news_file, 'wb') as f:
+                f.write(orjson.dumps(filtered, option=orjson.OPT_APPEND_NEWLINE))
             logger.info(f"Saved all filtered news to {all_news_file}")
         except Exception as e:
             logger.error(f"Failed to save all_news file: {e}")
@@ -272,6 +487,76 @@ class NewsAggregator:
         self._save_seen_hashes()
         return filtered
 
+    def _prefilter(self, items: List[Dict], keep: int = PREFILTER_KEEP) -> List[Dict]:
+        """
+        Cheap local score (recency, source weight, description length) to cut
+        the candidate list down to `keep` items before paying for LLM ranking.
+        """
+        if len(items) <= keep:
+            return items
+        now = time.time()
+        published = np.array([_parse_epoch(it.get('published date', '')) or now for it in items], dtype=np.float64)
+        source_w = np.array([self.source_weights.get(it.get('source', ''), 1.0) for it in items], dtype=np.float64)
+        desc_len = np.array([len(it.get('description') or '') for it in items], dtype=np.float64)
+
+        age_hours = np.maximum(now - published, 0) / 3600
+        scores = (PREFILTER_W_RECENCY * np.exp(-age_hours / PREFILTER_HALF_LIFE_HOURS)
+                  + PREFILTER_W_SOURCE * source_w
+                  + PREFILTER_W_LENGTH * np.minimum(desc_len / 500, 1))
+        # O(N) top-k; keep the survivors in their original order
+        top = np.sort(np.argpartition(scores, -keep)[-keep:])
+        logger.info(f"Pre-filtered {len(items)} stories down to {keep} for ranking.")
+        return [items[i] for i in top]
+
+    def _rank_chunk(self, chunk: List[Dict], offset: int) -> Dict[int, Dict]:
+        """
+        Rank one chunk of stories with a JSON-mode DeepSeek call.
+        Returns global 1-based story index -> ranking dict.
+        """
+        stories = "\n".join(
+            f"STORY {i}:\nTitle: {it.get('title', 'No Title')}\nDescription: {it.get('description', 'No Description')}\n"
+            for i, it in enumerate(chunk, 1)
+        )
+        resp = self.deepseek_client.generate(
+            model=self.ranking_model,
+            prompt=RANKING_PROMPT.format(count=len(chunk)) + stories,
+            format='json',
+            keep_alive='10m',
+            options={
+                'temperature': 0,
+                'top_k': 1,
+                'num_predict': RANK_TOKENS_PER_STORY * len(chunk),
+                'num_ctx': 4096
+            },
+            stream=False
+        )
+        if 'response' not in resp:
+            logger.error("DeepSeek pick_top_stories missing 'response' key.")
+            return {}
+        raw_response = resp['response']
+        logger.debug(f"DeepSeek raw response:\n{raw_response}")
+
+        data = orjson.loads(raw_response)
+        # JSON mode returns an object; accept a bare list too
+        rankings = data.get('rankings', []) if isinstance(data, dict) else data
+        parsed = {}
+        for entry in rankings:
+            try:
+                idx = int(entry['idx'])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if not 1 <= idx <= len(chunk):
+                continue
+            scores = {}
+            for k in ("importance", "entertainment", "combined"):
+                try:
+                    scores[k] = float(entry.get(k, 0))
+                except (TypeError, ValueError):
+                    scores[k] = 0
+            scores["reasoning"] = str(entry.get("reasoning", ""))
+            parsed[offset + idx] = scores
+        return parsed
+
     def pick_top_stories(self, items: List[Dict], count: int = 9) -> List[Dict]:
         """
         Use DeepSeek to rank news items by importance and entertainment.
@@ -287,112 +572,40 @@ class NewsAggregator:
             logger.warning(f"Only {available_count} stories available. Expected {count}. Proceeding with available stories.")
             count = available_count
 
-        # Build prompt for DeepSeek
-        prompt_lines = []
-        for i, it in enumerate(items, 1):
-            prompt_lines.append(f"""STORY {i}:
-Title: {it.get('title', 'No Title')}
-Description: {it.get('description', 'No Description')}
-
-""")
+        items = self._prefilter(items, max(count, self.config.get('prefilter_keep', PREFILTER_KEEP)))
 
-        ranking_prompt = f"""We have {len(items)} news stories. For each story, assign:
-- Importance score (0-10)
-- Entertainment score (0-10)
-- Combined rating (0-100)
-
-Provide a short reasoning for each assignment.
-
-Format EXACTLY:
-
-STORY X
-Importance: #
-Entertainment: #
-Combined: #
-Reasoning: ...
-STORY X
-...
-"""
-
-        full_prompt = ranking_prompt + "\n".join(prompt_lines)
-
-        # Call DeepSeek
-        try:
-            logger.info("Calling DeepSeek to rank news stories.")
-            resp = self.deepseek_client.generate(
-                model=self.deepseek_model,
-                prompt=full_prompt,
-                stream=False
-            )
-            if 'response' not in resp:
-                logger.error("DeepSeek pick_top_stories missing 'response' key.")
-                return []
-            raw_response = resp['response']
-            logger.debug(f"DeepSeek raw response:\n{raw_response}")  # Added for debugging
-        except Exception as e:
-            logger.error(f"DeepSeek error during ranking: {e}")
+        # Rank in small chunks: short prompts are faster per story and the model
+        # keeps to the JSON schema far more reliably than over one huge prompt
+        chunks = [(off, items[off:off + RANK_CHUNK_SIZE]) for off in range(0, len(items), RANK_CHUNK_SIZE)]
+        logger.info(f"Calling DeepSeek to rank {len(items)} news stories in {len(chunks)} chunks.")
+        parse_map = {}
+        workers = max(1, min(self.config.get('deepseek_concurrency', 2), len(chunks)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self._rank_chunk, chunk, off) for off, chunk in chunks]
+            for future in futures:
+                try:
+                    parse_map.update(future.result())
+                except Exception as e:
+                    logger.error(f"DeepSeek error during ranking: {e}")
+
+        if not parse_map:
+            logger.error("DeepSeek returned no usable rankings.")
             return []
 
-        # Parse DeepSeek response
-        lines = raw_response.split("\n")
-        parse_map = {}
-        current = None
-        for ln in lines:
-            l = ln.strip()
-            if l.startswith("STORY "):
-                if current:
-                    parse_map[current["idx"]] = current
-                m = re.match(r"STORY\s+(\d+)", l)
-                if m:
-                    idx = int(m.group(1))
-                    current = {"idx": idx, "scores": {}}
-            elif ":" in l and current:
-                kv = l.split(":", 1)
-                if len(kv) == 2:
-                    k = kv[0].strip().lower()
-                    v = kv[1].strip()
-                    if k in ["importance", "entertainment", "combined"]:
-                        try:
-                            current["scores"][k] = float(v)
-                        except:
-                            current["scores"][k] = 0
-                    elif k == "reasoning":
-                        current["reasoning"] = v
-        if current:
-            parse_map[current["idx"]] = current
-
-        # Assign scores to items
-        scored_items = []
+        # Assign scores to items; stories the model skipped rank last
         for i, item in enumerate(items, 1):
-            if i in parse_map:
-                c_score = parse_map[i]["scores"].get("combined", 0)
-                item["deepseek_ranking"] = {
-                    "importance": parse_map[i]["scores"].get("importance", 0),
-                    "entertainment": parse_map[i]["scores"].get("entertainment", 0),
-                    "combined": c_score,
-                    "reasoning": parse_map[i].get("reasoning", "")
-                }
-                scored_items.append(item)
-            else:
-                # Handle missing ranking data
-                item["deepseek_ranking"] = {
-                    "importance": 0,
-                    "entertainment": 0,
-                    "combined": 0,
-                    "reasoning": "No ranking data"
-                }
-                scored_items.append(item)
-
-        # Sort by combined score descending
-        scored_items.sort(key=lambda x: x["deepseek_ranking"]["combined"], reverse=True)
+            item["deepseek_ranking"] = parse_map.get(i) or dict(_NO_RANKING)
+
+        # Sort by combined score descending, into a new list: items may be the caller's own
+        scored_items = sorted(items, key=lambda x: x["deepseek_ranking"]["combined"], reverse=True)
         picked = scored_items[:count]
 
         # Save top stories
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         top_file = os.path.join(self.top_news_dir, f"top_stories_{ts}.json")
         try:
-            with open(top_file, 'w', encoding='utf-8') as f:
-                json.dump(picked, f, indent=2)
+            with open(top_file, 'wb') as f:
+                f.write(orjson.dumps(picked, option=orjson.OPT_APPEND_NEWLINE))
             logger.info(f"Saved top {count} stories to {top_file}")
         except Exception as e:
             logger.error(f"Failed to save top_stories file: {e}")
@@ -0,0 +1,59 @@
+import cv2
+import functools
+import mss
+import numpy as np
+from typing import Dict, Optional, Tuple
+
+# One capture handle for the process; creating mss per grab throws away its
+# cached device context and costs more than the grab itself.
+# mss handles are tied to the thread that created them, so grab from one thread.
+_sct = None
+
+TEMPLATE_CACHE_SIZE = 64
+
+def _get_sct():
+    global _sct
+    if _sct is None:
+        _sct = mss.mss()
+    return _sct
+
+def monitor_rect(region=None) -> Dict[str, int]:
+    """Translate a pyautogui-style (left, top, width, height) region into an mss monitor."""
+    if region is None:
+        return _get_sct().monitors[1]  # Primary monitor, like pyautogui
+    left, top, width, height = region
+    return {'left': int(left), 'top': int(top), 'width': int(width), 'height': int(height)}
+
+def grab(region=None) -> np.ndarray:
+    """Capture the region (or the primary monitor) as a BGR numpy array."""
+    return np.asarray(_get_sct().grab(monitor_rect(region)))[:, :, :3]
+
+@functools.lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _load_template(path: str, grayscale: bool) -> np.ndarray:
+    template = cv2.imread(path, cv2.IMREAD_GRAYSCALE if grayscale else cv2.IMREAD_COLOR)
+    if template is None:
+        # Raising keeps failures out of the cache, so a fixed file is picked up next call
+        raise FileNotFoundError(f"Template image not readable: {path}")
+    return template
+
+def load_template(image_path, grayscale=True) -> np.ndarray:
+    """Decode a template image once and reuse it on every poll (grayscale and color cached separately)."""
+    return _load_template(str(image_path), grayscale)
+
+def locate_center(image_path, confidence=0.8, grayscale=True, region=None) -> Optional[Tuple[int, int]]:
+    """
+    Drop-in replacement for pyautogui.locateCenterOnScreen: returns the screen
+    (x, y) of the best TM_CCOEFF_NORMED match, or None below `confidence`.
+    """
+    template = load_template(image_path, grayscale)
+    monitor = monitor_rect(region)
+    haystack = np.asarray(_get_sct().grab(monitor))
+    haystack = cv2.cvtColor(haystack, cv2.COLOR_BGRA2GRAY if grayscale else cv2.COLOR_BGRA2BGR)
+    th, tw = template.shape[:2]
+    if haystack.shape[0] < th or haystack.shape[1] < tw:
+        return None
+    res = cv2.matchTemplate(haystack, template, cv2.TM_CCOEFF_NORMED)
+    _, max_val, _, max_loc = cv2.minMaxLoc(res)
+    if max_val < confidence:
+        return None
+    return (monitor['left'] + max_loc[0] + tw // 2, monitor['top'] + max_loc[1] + th // 2)
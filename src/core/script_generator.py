@@ -1,20 +1,167 @@
+import asyncio
+import concurrent.futures
+import difflib
+import hashlib
+from collections import OrderedDict
 import os
 import json
 import logging
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import re
 
 import google.generativeai as genai
+import httpx
 from dotenv import load_dotenv
 from pathlib import Path
 import ollama
-from ollama import Client
+import orjson
+from ollama import AsyncClient, Client
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.DEBUG)  # Ensure debug logs are captured
 
+# Instruction blocks always lead their prompts and never change, with the variable
+# input after PROMPT_INPUT_DELIMITER, so Ollama reuses the already-evaluated prefix
+# from its prompt cache instead of re-prefilling it on every iteration
+DEEPSEEK_KEEP_ALIVE = '30m'
+PROMPT_INPUT_DELIMITER = "\n\n### INPUT\n"
+
+SCRIPT_INSTRUCTIONS = """You are a professional news scriptwriter. Generate a TV news broadcast script.
+
+**STRICT RULES:**
+1. Use ONLY these sections: [HOOK], [HEADLINES], [MAIN_STORY_1], [MAIN_STORY_2], [MAIN_STORY_3], [OUTRO]
+2. Output ONLY the spoken narration text
+3. NEVER include:
+   - AI reasoning/thinking (no <think>/</think>)
+   - Visual directions (e.g., "show map")
+   - Production notes
+   - Revision comments
+4. Use concise, spoken English with proper punctuation
+5. Maintain neutral tone with clear subject-verb-object structure
+
+**EXAMPLE FORMAT:**
+[HOOK]
+Breaking news tonight: [Concise attention-grabbing lead]
+
+[HEADLINES]
+- First headline summary
+- Second headline summary
+- Third headline summary
+
+[MAIN_STORY_1]
+Detailed report with key facts...
+
+[OUTRO]
+That's all for tonight. For updates visit..."""
+
+REFINE_ALL_INSTRUCTIONS = (
+    "**Revise each news script section in the JSON object below**.\n"
+    "Improve viewer engagement, clarity and neutrality. "
+    "Return a JSON object with EXACTLY the same keys, each mapped to ONLY the revised "
+    "spoken text. Do not add extraneous text or commentary."
+)
+
+REFINE_SECTION_INSTRUCTIONS = (
+    "**Revise the news script section below**.\n"
+    "First list 3 short improvement points for viewer engagement, clarity and neutrality "
+    "inside <think></think> tags, then apply them.\n"
+    "After the closing </think> tag output ONLY the revised section. "
+    "Do not add extraneous text or commentary."
+)
+
+GEMINI_CACHE_SIZE = 128
+# (model name, generation settings, prompt digest) -> response, shared by all generators.
+# Kept at module level so cached entries do not hold a ScriptGenerator alive
+_gemini_cache: "OrderedDict[Tuple, str]" = OrderedDict()
+
+SETTLED_SIMILARITY = 0.97   # Revisions this close to the previous text are treated as final
+SHORT_SECTION_WORDS = 40    # Short, well-formed revisions gain little from another round
+
+# Cleanup patterns, compiled once at import
+_THINK_RE = re.compile(r'(?i)\[?\/?think.*?\]?', re.DOTALL)  # Handles [Think], [THINK], [/think] etc
+# A [HEADER] on a line of its own, then everything up to the next header line
+_SECTION_RE = re.compile(
+    r'^[ \t]*\[([^\]\n]+)\][ \t\r]*$(.*?)(?=^[ \t]*\[[^\]\n]+\][ \t\r]*$|\Z)',
+    re.DOTALL | re.MULTILINE
+)
+# Single-pass cleanup: each pattern unions the removals with a named whitespace group
+_CLEAN_RE = re.compile(r'(?P<ws>\s+)|["{}*_#]|\b(?:metadata|sections)\b')
+_SANITIZE_RE = re.compile(r'(?P<ws>\s+)|\[[^\]]*\]|(?i:\b(?:revised\s+version|script\s+section):?)')
+
+# Markup that _clean_script does not remove; its presence means an LLM cleanup pass is needed
+_MARKUP_PROBE_RE = re.compile(r'[\[\]`<>]')
+
+# Critique bullets the model may leave, set off by a blank line, in front of the revision
+# when it skips the <think> tags
+_LEADING_BULLETS_RE = re.compile(r'\A(?:[ \t]*(?:[-*\u2022]|\d+[.)])[ \t]+[^\n]*\n)+[ \t]*\n(?=\s*\S)')
+
+def _strip_leading_bullets(text: str) -> str:
+    return _LEADING_BULLETS_RE.sub('', text).strip()
+
+def _remove_and_collapse(pattern: re.Pattern, text: str) -> str:
+    """
+    One walk over `text`: drops every match of `pattern`, and joins the kept
+    pieces with a single space wherever whitespace separated them. Same result
+    as removing, then collapsing whitespace, then stripping, in separate passes.
+    """
+    out = []
+    pos = 0
+    space = False
+    for m in pattern.finditer(text):
+        if m.start() > pos:
+            if space and out:
+                out.append(' ')
+            out.append(text[pos:m.start()])
+            space = False
+        if m.group('ws'):
+            space = True
+        pos = m.end()
+    if pos < len(text):
+        if space and out:
+            out.append(' ')
+        out.append(text[pos:])
+    return ''.join(out)
+
+class _ThinkFilter:
+    """
+    Streaming replacement for stripping <think>...</think> with a regex: feed()
+    takes response chunks in order and returns only the text outside think
+    blocks, holding back a possible partial tag split across chunks.
+    """
+
+    OPEN, CLOSE = '<think>', '</think>'
+
+    def __init__(self):
+        self._buf = ''
+        self._inside = False
+
+    def feed(self, chunk: str) -> str:
+        self._buf += chunk
+        out = []
+        while True:
+            tag = self.CLOSE if self._inside else self.OPEN
+            idx = self._buf.find(tag)
+            if idx != -1:
+                if not self._inside:
+                    out.append(self._buf[:idx])
+                self._buf = self._buf[idx + len(tag):]
+                self._inside = not self._inside
+                continue
+            # Keep only a tail that could still grow into the tag
+            keep = next((n for n in range(min(len(tag) - 1, len(self._buf)), 0, -1)
+                         if tag.startswith(self._buf[-n:])), 0)
+            if not self._inside:
+                out.append(self._buf[:len(self._buf) - keep])
+            self._buf = self._buf[len(self._buf) - keep:]
+            return ''.join(out)
+
+    def flush(self) -> str:
+        """Remaining text; an unterminated think block is dropped."""
+        rest, self._buf = ('' if self._inside else self._buf), ''
+        return rest
+
 class ScriptGenerator:
     """
     Generates and refines a professional news script with DeepSeek and Gemini Flash.
@@ -26,6 +173,8 @@ class ScriptGenerator:
         self.brand_name = config.get('brand_name', 'Veritas Lens AI')
         self.max_refine_iterations = config.get('max_refine_iterations', 3)
         self.deepseek_model = config.get('deepseek_model', 'deepseek-r1')
+        # Sections refined at once; keeps Ollama's request queue short
+        self.refine_concurrency = config.get('refine_concurrency', 3)
 
         # Directories for storing scripts
         base_dir = os.path.join(os.path.dirname(__file__), '..', '..')
@@ -34,8 +183,18 @@ class ScriptGenerator:
         os.makedirs(self.temp_refine_dir, exist_ok=True)
         os.makedirs(self.narration_dir, exist_ok=True)
 
-        # Initialize DeepSeek LLM client
-        self.deepseek_client = Client()
+        # Debug iteration files are written off the refinement loop's critical path
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        self._pending_saves = []
+
+        # Initialize DeepSeek LLM client. One pooled, keep-alive connection set is
+        # reused by every call instead of reconnecting per request
+        self._ollama_http = dict(
+            host=config.get('ollama_host'),
+            timeout=httpx.Timeout(config.get('deepseek_timeout', 300), connect=5.0),
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=8)
+        )
+        self.deepseek_client = Client(**self._ollama_http)
 
         # Initialize Gemini Flash LLM client
         self.gemini_api_key = os.getenv("GOOGLE_API_KEY", "")
@@ -71,12 +230,8 @@ class ScriptGenerator:
                 return None
             logger.info("Parsed bracketed sections from initial script.")
 
-            # 3) Refine each section with iterative approach
-            refined_sections = {}
-            for section_key, section_text in sections.items():
-                new_text = self._iterative_refine_section(section_key, section_text)
-                refined_sections[section_key] = new_text
-                logger.info(f"Section '{section_key}' refined successfully.")
+            # 3) Refine all sections concurrently with the iterative approach
+            refined_sections = asyncio.run(self._refine_sections(sections))
 
             # 4) Cleanup for TTS
             cleaned_sections = {}
@@ -100,8 +255,9 @@ class ScriptGenerator:
             narration_filename = f"final_narration_{timestamp}.json"
             narration_path = os.path.join(self.narration_dir, narration_filename)
 
-            with open(narration_path, 'w', encoding='utf-8') as f:
-                json.dump(final_narration, f, indent=2)
+            # Serialize into one buffer and hand it to the OS in a single write
+            with open(narration_path, 'wb') as f:
+                f.write(orjson.dumps(final_narration, option=orjson.OPT_INDENT_2))
 
             logger.info(f"Final narration script saved to {narration_path}")
             return final_narration
@@ -109,6 +265,8 @@ class ScriptGenerator:
         except Exception as e:
             logger.exception(f"An error occurred during script generation: {e}")
             return None
+        finally:
+            self._flush_saves()
 
     def _build_initial_script(self, stories: List[Dict]) -> str:
         """
@@ -121,38 +279,9 @@ class ScriptGenerator:
         """Structured prompt with output constraints"""
         story_details = "\n".join([f"- {s.get('title')}: {s.get('description')}" 
                                 for s in stories])
-        return f"""
-You are a professional news scriptwriter. Generate a TV news broadcast script.
-
-**STRICT RULES:**
-1. Use ONLY these sections: [HOOK], [HEADLINES], [MAIN_STORY_1], [MAIN_STORY_2], [MAIN_STORY_3], [OUTRO]
-2. Output ONLY the spoken narration text
-3. NEVER include:
-   - AI reasoning/thinking (no <think>/</think>)
-   - Visual directions (e.g., "show map")
-   - Production notes
-   - Revision comments
-4. Use concise, spoken English with proper punctuation
-5. Maintain neutral tone with clear subject-verb-object structure
-
-**TOP STORIES:**
+        return SCRIPT_INSTRUCTIONS + PROMPT_INPUT_DELIMITER + f"""**TOP STORIES:**
 {story_details}
 
-**EXAMPLE FORMAT:**
-[HOOK]
-Breaking news tonight: [Concise attention-grabbing lead]
-
-[HEADLINES]
-- First headline summary
-- Second headline summary
-- Third headline summary
-
-[MAIN_STORY_1]
-Detailed report with key facts...
-
-[OUTRO]
-That's all for tonight. For updates visit...
-
 Generate the news script:"""
 
     def _parse_bracketed_sections(self, raw_text: str) -> Dict[str, str]:
@@ -161,108 +290,208 @@ Generate the news script:"""
         Removes any extraneous meta commentary including <think> tags.
         """
         # Enhanced removal of chain-of-thought markers with different casing
-        raw_text = re.sub(
-            r'(?i)\[?\/?think.*?\]?',  # Handles [Think], [THINK], [/think] etc
-            '', 
-            raw_text, 
-            flags=re.DOTALL
-        )
+        raw_text = _THINK_RE.sub('', raw_text)
         
+        # One pass over (header, body) pairs; split/join also normalizes whitespace
         sections = {}
-        current_section = None
-        buffer = []
-
-        for line in raw_text.splitlines():
-            line = line.strip()
-            match = re.match(r'^\[(.*?)\]$', line)
-            if match:
-                if current_section and buffer:
-                    sections[current_section] = " ".join(buffer).strip()
-                current_section = match.group(1).lower().replace(" ", "_")
-                buffer = []
-            elif current_section:
-                buffer.append(line)
-        if current_section and buffer:
-            sections[current_section] = " ".join(buffer).strip()
-
+        for match in _SECTION_RE.finditer(raw_text):
+            body = " ".join(match.group(2).split())
+            if body:
+                sections[match.group(1).strip().lower().replace(" ", "_")] = body
         return sections
 
-    def _iterative_refine_section(self, section_key: str, section_text: str) -> str:
+    async def _refine_sections(self, sections: Dict[str, str]) -> Dict[str, str]:
         """
-        Iteratively refines a script section using Gemini for critique
-        and DeepSeek for revisions based on that critique.
+        Refine all sections together in one JSON call per iteration. If the model
+        cannot produce usable JSON, refine every section concurrently instead;
+        sections are independent, so wall time is roughly that of the slowest one.
         """
-        refined = section_text
+        # Async clients and semaphores belong to the loop that asyncio.run creates,
+        # so the client's connection pool is opened per run and closed before the loop ends
+        self._async_deepseek = AsyncClient(**self._ollama_http)
+        # Ollama runs requests on one model serially; more in flight only queue up server-side
+        self._deepseek_sem = asyncio.Semaphore(self.config.get('deepseek_concurrency', 1))
+        try:
+            refined = await self._refine_all_sections(sections)
+            if refined is not None:
+                return refined
+            logger.warning("Batched refinement unusable; refining sections individually.")
+
+            semaphore = asyncio.Semaphore(self.refine_concurrency)
+
+            async def refine(key: str, text: str) -> str:
+                async with semaphore:
+                    new_text = await self._iterative_refine_section(key, text)
+                logger.info(f"Section '{key}' refined successfully.")
+                return new_text
+
+            results = await asyncio.gather(*(refine(k, v) for k, v in sections.items()))
+            return dict(zip(sections.keys(), results))
+        finally:
+            # ollama's AsyncClient wraps an httpx.AsyncClient; close that across ollama versions
+            await self._async_deepseek._client.aclose()
+            self._async_deepseek = None
+
+    async def _refine_all_sections(self, sections: Dict[str, str]) -> Optional[Dict[str, str]]:
+        """
+        Refines every section in a single DeepSeek JSON call per iteration, so the
+        instructions and network round trip are paid once for the whole script.
+        Returns None if the first call yields nothing usable.
+        """
+        refined = dict(sections)
+        # Only sections that still need work are sent on the next round
+        pending = {k for k, v in refined.items() if self._needs_refinement(v)}
         for iteration in range(self.max_refine_iterations):
-            if not refined.strip():
+            if not pending:
+                break
+            batch = {k: refined[k] for k in refined if k in pending}
+            prompt = REFINE_ALL_INSTRUCTIONS + PROMPT_INPUT_DELIMITER + orjson.dumps(batch).decode()
+            raw_output = await self._call_deepseek_async(prompt, format='json')
+            try:
+                revised = orjson.loads(raw_output)
+            except orjson.JSONDecodeError:
+                logger.warning("Failed parsing batched refinement, attempting recovery...")
+                revised = self._recover_structured_content(raw_output)
+            if not isinstance(revised, dict) or not revised:
+                if iteration == 0:
+                    return None
                 break
 
-            # 1) Generate critique with Gemini
-            critique = self._call_gemini(
-                f"**Critique this news script section**:\n{refined}\n\n"
-                "Focus on viewer engagement, clarity, neutrality. Provide short bullet points of improvement."
-            )
-            if not critique.strip():
-                logger.warning(f"Empty critique for section '{section_key}' (iteration {iteration+1}).")
+            improved = False
+            for key, old_text in batch.items():
+                new_text = revised.get(key)
+                if isinstance(new_text, str) and self._is_improved(old_text, new_text):
+                    refined[key] = new_text.strip()
+                    improved = True
+                    self._save_iteration(key, iteration, refined[key])
+                    if not self._needs_refinement(refined[key], old_text):
+                        pending.discard(key)
+                else:
+                    pending.discard(key)
+            if not improved:
+                logger.debug(f"No section improved at iteration {iteration+1}. Stopping.")
                 break
+            logger.debug(f"Sections refined in batched iteration {iteration+1}.")
 
-            # 2) Generate revision with DeepSeek
-            revision_prompt = (
-                f"**Revise this news script section**:\n{refined}\n\n"
-                f"**Apply these critique points**:\n{critique}\n\n"
-                "Limit changes to clarity, engagement, neutrality. Do not add extraneous text or commentary."
-            )
-            revised = self._call_deepseek(revision_prompt)
+        return refined
+
+    async def _iterative_refine_section(self, section_key: str, section_text: str) -> str:
+        """
+        Iteratively refines a script section. Each iteration is a single DeepSeek
+        call that critiques the section privately and returns only the revision.
+        """
+        refined = section_text
+        if not self._needs_refinement(refined):
+            return refined
+        for iteration in range(self.max_refine_iterations):
+            if not refined.strip():
+                break
+
+            # 1) Critique and revise in one call
+            revision_prompt = REFINE_SECTION_INSTRUCTIONS + PROMPT_INPUT_DELIMITER + refined
+            revised = _strip_leading_bullets(await self._call_deepseek_async(revision_prompt))
             if not revised.strip():
                 logger.debug(f"DeepSeek revision empty. Keeping previous version for '{section_key}'.")
                 break
 
-            # 3) Compare old vs new for improvement
+            # 2) Compare old vs new for improvement
             if self._is_improved(refined, revised):
-                refined = revised
+                previous, refined = refined, revised
                 logger.debug(f"Section '{section_key}' improved in iteration {iteration+1}.")
             else:
                 logger.debug(f"No improvement for section '{section_key}' at iteration {iteration+1}. Stopping.")
                 break
 
-            # 4) Save iteration
+            # 3) Save iteration
             self._save_iteration(section_key, iteration, refined)
 
+            # 4) Skip the next round trip if this one barely changed anything
+            if not self._needs_refinement(refined, previous):
+                logger.debug(f"Section '{section_key}' settled at iteration {iteration+1}.")
+                break
+
         return refined
 
-    def _call_deepseek(self, prompt: str) -> str:
+    def _call_deepseek(self, prompt: str, **kwargs) -> str:
         """
         Calls DeepSeek to generate or revise the script.
+        Extra keyword arguments (e.g. options) go to generate().
         """
         try:
-            response = self.deepseek_client.generate(
+            stream = self.deepseek_client.generate(
                 model=self.deepseek_model, 
                 prompt=prompt, 
-                stream=False
+                keep_alive=DEEPSEEK_KEEP_ALIVE,
+                stream=True,
+                **kwargs
             )
-            # Add immediate response cleaning
-            raw_response = response.get('response', "")
-            return re.sub(r'<think>.*?</think>', '', raw_response, flags=re.DOTALL).strip()
+            # Strip <think> blocks as chunks arrive, so the joined text is already clean
+            think_filter = _ThinkFilter()
+            parts = [think_filter.feed(chunk.get('response', "")) for chunk in stream]
+            parts.append(think_filter.flush())
+            return "".join(parts).strip()
         except Exception as e:
             logger.error(f"DeepSeek API call failed: {e}")
             return ""
 
-    def _call_gemini(self, prompt: str) -> str:
+    async def _call_deepseek_async(self, prompt: str, **kwargs) -> str:
+        """
+        Async variant of _call_deepseek, used by the refinement loops.
+        Extra keyword arguments (e.g. format='json') go to generate().
+        """
+        async with self._deepseek_sem:
+            try:
+                stream = await self._async_deepseek.generate(
+                    model=self.deepseek_model,
+                    prompt=prompt,
+                    keep_alive=DEEPSEEK_KEEP_ALIVE,
+                    stream=True,
+                    **kwargs
+                )
+                think_filter = _ThinkFilter()
+                parts = [think_filter.feed(chunk.get('response', "")) async for chunk in stream]
+                parts.append(think_filter.flush())
+                return "".join(parts).strip()
+            except Exception as e:
+                logger.error(f"DeepSeek API call failed: {e}")
+                return ""
+
+    def _call_gemini(self, prompt: str, temperature: Optional[float] = None,
+                     max_tokens: Optional[int] = None) -> str:
         """
         Calls Gemini Flash model to critique or assist with short instructions.
+        Identical prompts are answered from a small LRU cache.
         """
         if not self.gemini_model:
             logger.warning("Gemini model not configured. Returning empty critique.")
             return ""
+        generation_config = {}
+        if temperature is not None:
+            generation_config['temperature'] = temperature
+        if max_tokens is not None:
+            generation_config['max_output_tokens'] = max_tokens
+        key = (
+            self.gemini_model.model_name,
+            tuple(sorted(generation_config.items())),
+            hashlib.blake2b(prompt.encode('utf-8'), digest_size=16).hexdigest()
+        )
+        cached = _gemini_cache.get(key)
+        if cached is not None:
+            _gemini_cache.move_to_end(key)
+            return cached
         try:
-            response = self.gemini_model.generate_content(prompt)
-            if response and response.text:
-                return response.text.strip()
-            else:
-                return ""
+            response = self.gemini_model.generate_content(
+                prompt, generation_config=generation_config or None, stream=True
+            )
+            text = "".join(chunk.text for chunk in response if chunk.parts).strip()
         except Exception as e:
             logger.error(f"Gemini Flash call failed: {e}")
             return ""
+        if text:
+            _gemini_cache[key] = text
+            if len(_gemini_cache) > GEMINI_CACHE_SIZE:
+                _gemini_cache.popitem(last=False)
+        return text
 
     def _is_improved(self, old_text: str, new_text: str) -> bool:
         """
@@ -272,49 +501,74 @@ Generate the news script:"""
         new_c = new_text.strip().lower()
         return (old_c != new_c) and (len(new_text.strip()) > 0)
 
-    def _final_tts_filter(self, structured_output: dict) -> str:
-        """Hybrid cleaning approach using Gemini Flash + regex"""
-        # First LLM-based cleaning
-        cleaning_prompt = """Extract ONLY spoken text from this JSON structure.
-        Remove ALL technical fields/metadata. Combine into continuous prose.
+    def _needs_refinement(self, text: str, previous: Optional[str] = None) -> bool:
+        """
+        Cheap local check for whether another LLM round is worth paying for.
+        False when the last revision changed almost nothing, or when a revision
+        has already produced a short, well-formed passage. Untouched input
+        (no `previous`) always gets at least one round.
+        """
+        if not text.strip():
+            return False
+        if previous is None:
+            return True
+        matcher = difflib.SequenceMatcher(None, previous, text, autojunk=False)
+        # quick_ratio is an upper bound on ratio, so it can rule settling out cheaply
+        if matcher.quick_ratio() > SETTLED_SIMILARITY and matcher.ratio() > SETTLED_SIMILARITY:
+            return False
+        stripped = text.strip()
+        balanced = stripped.count('[') == stripped.count(']') and stripped.count('(') == stripped.count(')')
+        if len(stripped.split()) < SHORT_SECTION_WORDS and balanced and stripped[-1] in '.!?"':
+            return False
+        return True
+
+    def _final_tts_filter(self, structured_output) -> str:
+        """
+        Deterministic extraction of the spoken text plus regex cleanup. Gemini is
+        only asked to clean up when markup survives the regex pass.
+        """
+        if isinstance(structured_output, dict):
+            sections = structured_output.get('sections', structured_output)
+            text = ' '.join(v for v in sections.values() if isinstance(v, str))
+        else:
+            text = str(structured_output)
+        cleaned = self._clean_script(text)
+        if not _MARKUP_PROBE_RE.search(cleaned):
+            return cleaned
+
+        cleaning_prompt = """Extract ONLY spoken text from this script.
+        Remove ALL technical fields/metadata and markup. Combine into continuous prose.
         
-        Input: {structured_output}
+        Input: {text}
         Output:"""
-        
-        try:
-            gemini_clean = self._generate_content(
-                cleaning_prompt.format(structured_output=structured_output),
-                llm_choice='gemini_flash',
-                temperature=0.1
-            )
-        except Exception as e:
-            logger.error(f"Gemini cleaning failed: {e}")
-            gemini_clean = str(structured_output)
-        
+        gemini_clean = self._call_gemini(cleaning_prompt.format(text=cleaned), temperature=0.1)
         # Final regex safety net
-        return self._clean_script(gemini_clean)
+        return self._clean_script(gemini_clean or cleaned)
 
     def _clean_script(self, script: str) -> str:
-        """Lightweight regex-based final cleanup"""
-        # Remove JSON artifacts
-        script = re.sub(r'["{}]|\b(?:metadata|sections)\b', '', script)
-        
-        # Remove residual special characters
-        script = re.sub(r'[*_#]', '', script)
-        
-        # Normalize whitespace
-        return re.sub(r'\s+', ' ', script).strip()
+        """Lightweight regex-based final cleanup: JSON artifacts, special characters, whitespace"""
+        return _remove_and_collapse(_CLEAN_RE, script)
 
     def _save_iteration(self, section_key: str, iteration: int, content: str):
         """
-        Saves iteration text for debugging and transparency.
+        Saves iteration text for debugging and transparency, on a background thread.
         """
+        self._pending_saves.append(
+            self._io_pool.submit(self._save_iteration_blocking, section_key, iteration, content)
+        )
+
+    def _flush_saves(self):
+        """Wait for queued iteration files to be written."""
+        concurrent.futures.wait(self._pending_saves)
+        self._pending_saves.clear()
+
+    def _save_iteration_blocking(self, section_key: str, iteration: int, content: str):
         section_dir = os.path.join(self.temp_refine_dir, f"section_{section_key}")
         os.makedirs(section_dir, exist_ok=True)
         filename = f"iteration_{iteration+1}.txt"
         path = os.path.join(section_dir, filename)
         try:
-            with open(path, 'w', encoding='utf-8') as f:
+            with open(path, 'w', encoding='utf-8', buffering=8192) as f:
                 f.write(content)
             logger.debug(f"Saved iteration {iteration+1} for section '{section_key}' at {path}.")
         except Exception as e:
@@ -324,20 +578,12 @@ Generate the news script:"""
         raw_output = self._generate_structured_content(prompts)
         return self._final_tts_filter(raw_output)
 
-    def _generate_content(self, prompt: str, llm_choice: str = None, **kwargs) -> str:
-        llm_choice = llm_choice or self.config.get('llm_choice', 'local_deepseek')
-        
-        if 'gemini' in llm_choice.lower():
-            return self._gemini_client.generate(prompt, **kwargs)
-        else:
-            return self._deepseek_client.generate(prompt, **kwargs)
-
     def _generate_structured_content(self, prompts: dict) -> dict:
         """
         Generates content with enforced JSON structure using DeepSeek R1
         """
         structure_prompt = f"""Generate news script as JSON with EXACTLY these keys:
-        {json.dumps(list(prompts.keys()))}
+        {orjson.dumps(list(prompts.keys())).decode()}
         
         Rules:
         1. Output ONLY spoken narration text
@@ -349,16 +595,29 @@ Generate the news script:"""
         """
         
         try:
-            raw_output = self._generate_content(
-                structure_prompt,
-                llm_choice='local_deepseek',
-                temperature=0.3
-            )
-            return json.loads(raw_output)
-        except json.JSONDecodeError:
+            raw_output = self._call_deepseek(structure_prompt, options={'temperature': 0.3})
+            return orjson.loads(raw_output)
+        except orjson.JSONDecodeError:
             logger.warning("Failed parsing structured output, attempting recovery...")
             return self._recover_structured_content(raw_output)
 
+    def _recover_structured_content(self, raw_output: str) -> Dict[str, str]:
+        """
+        Salvage a JSON object from output wrapped in prose or code fences;
+        fall back to bracketed [SECTION] headers. Returns {} if neither works.
+        """
+        if not raw_output:
+            return {}
+        start, end = raw_output.find('{'), raw_output.rfind('}')
+        if start != -1 and end > start:
+            try:
+                data = json.loads(raw_output[start:end + 1])
+                if isinstance(data, dict):
+                    return data
+            except json.JSONDecodeError:
+                pass
+        return self._parse_bracketed_sections(raw_output)
+
     def _gemini_tts_cleanup(self, raw_text: str) -> str:
         """Final cleanup using Gemini Flash 2.0 to remove non-broadcast content"""
         cleanup_prompt = """STRICT INSTRUCTIONS FOR NEWS SCRIPT CLEANUP:
@@ -376,27 +635,19 @@ INPUT TEXT TO CLEAN:
 
 CLEAN OUTPUT:"""
         
-        try:
-            response = self._generate_content(
-                cleanup_prompt.format(input=raw_text),
-                llm_choice='gemini_flash',
-                temperature=0.1,  # Keep highly deterministic
-                max_tokens=4000
-            )
-            return self._final_sanitization(response)
-        
-        except Exception as e:
-            logger.error(f"Gemini TTS cleanup failed: {e}")
-            return self._fallback_cleanup(raw_text)
+        # _call_gemini logs its own failures and returns "" instead of raising
+        response = self._call_gemini(
+            cleanup_prompt.format(input=raw_text),
+            temperature=0.1,  # Keep highly deterministic
+            max_tokens=4000
+        )
+        if not response:
+            logger.warning("Gemini TTS cleanup returned nothing; sanitizing the raw text instead")
+        return self._final_sanitization(response or raw_text)
 
     def _final_sanitization(self, text: str) -> str:
-        """Last-chance regex cleanup"""
-        # Remove residual metadata markers
-        text = re.sub(r'(?i)\b(revised\s+version|script\s+section):?', '', text)
-        # Remove any remaining bracketed comments
-        text = re.sub(r'\[[^\]]*\]', '', text)
-        # Collapse whitespace
-        return re.sub(r'\s+', ' ', text).strip()
+        """Last-chance regex cleanup: metadata markers, bracketed comments, whitespace"""
+        return _remove_and_collapse(_SANITIZE_RE, text)
 
     def generate_tts_ready_script(self, raw_json: dict) -> str:
         """Full processing pipeline"""
@@ -1,10 +1,14 @@
-from redis import Redis
+from redis import ConnectionPool, Redis
 from rq import Queue
+from rq.job import Job
 from rq.registry import FailedJobRegistry
 
+# One pool for the process, so every TaskManager reuses the same open connections
+_POOL = ConnectionPool(host='redis', port=6379, max_connections=32, health_check_interval=30)
+
 class TaskManager:
     def __init__(self):
-        self.redis = Redis(host='redis', port=6379)
+        self.redis = Redis(connection_pool=_POOL)
         self.queue = Queue(connection=self.redis)
         self.registry = FailedJobRegistry(queue=self.queue)
         
@@ -12,10 +16,17 @@ class TaskManager:
         return self.queue.enqueue(func, *args)
     
     def retry_failed(self):
-        for job_id in self.registry.get_job_ids():
-            job = self.queue.fetch_job(job_id)
-            self.queue.enqueue(job.func, *job.args, **job.kwargs)
-            self.registry.remove(job)
+        job_ids = self.registry.get_job_ids()
+        if not job_ids:
+            return
+        # One bulk fetch and one pipelined write instead of several round trips per job
+        jobs = Job.fetch_many(job_ids, connection=self.redis)
+        with self.redis.pipeline(transaction=False) as pipe:
+            for job_id, job in zip(job_ids, jobs):
+                if job is not None:
+                    self.queue.enqueue_job(job, pipeline=pipe)
+                self.registry.remove(job or job_id, pipeline=pipe)
+            pipe.execute()
     
     def monitor_queue(self):
         return {
@@ -2,6 +2,8 @@ import pyautogui
 import time
 import logging
 import os
+from pathlib import Path
+from core.screen import load_template, locate_center
 
 # Configure logging
 logging.basicConfig(
@@ -9,48 +11,38 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+# Resolved once at import: same image as the main code, and the right 20% of the screen
+_IMAGE_PATH = Path(__file__).resolve().parent.parent / "data" / "pyautogui_image_files" / "three_dots_image.png"
+_SCREEN_W, _SCREEN_H = pyautogui.size()
+_CUSTOM_REGION = (int(_SCREEN_W * 0.8), 0, int(_SCREEN_W * 0.2), _SCREEN_H)
+
 def test_three_dots_detection():
     """Test three dots menu detection with adjustable parameters."""
     try:
-        # Get image path using same resolution as main code
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        parent_dir = os.path.dirname(current_dir)
-        image_path = os.path.join(
-            parent_dir,
-            "data",
-            "pyautogui_image_files",
-            "three_dots_image.png"
-        )
-        
-        if not os.path.exists(image_path):
+        image_path = _IMAGE_PATH
+        if not image_path.exists():
             raise FileNotFoundError(f"Image missing at {image_path}")
+        # Decode the PNG once up front; every attempt below reuses the cached array
+        template = load_template(image_path, grayscale=True)
 
         # Configurable test parameters
         confidence = 0.9  # Lower threshold
         grayscale = True  # Match main code's grayscale
-        region = None  # Search full screen
         attempts = 5
-        delay_between_attempts = 2  # seconds
+        first_delay = 0.2  # seconds; doubles after each miss
+        max_delay = 2
+        debug_overlay = bool(os.environ.get("DEBUG_OVERLAY"))
 
-        # Alternative region calculation
-        screen_width, screen_height = pyautogui.size()
-        custom_region = (
-            int(screen_width * 0.8),  # Right 20%
-            0,
-            int(screen_width * 0.2),  # 20% width
-            screen_height
-        )
+        custom_region = _CUSTOM_REGION
 
         logging.info(f"Starting three dots detection test with:")
         logging.info(f"Image: {image_path}")
+        logging.info(f"Template size: {template.shape[1]}x{template.shape[0]}")
         logging.info(f"Confidence: {confidence}")
         logging.info(f"Custom Region: {custom_region}")
-        logging.info(f"Resolved image path: {os.path.abspath(image_path)}")
 
-        for attempt in range(1, attempts+1):
-            logging.info(f"Attempt {attempt}/{attempts}")
-            
-            # Visual feedback for search area
+        # Visual feedback for search area, only when asked for; it blocks on a dialog
+        if debug_overlay:
             pyautogui.alert("Check screen for region highlight")
             pyautogui.moveTo(custom_region[0], custom_region[1])
             pyautogui.dragTo(
@@ -59,23 +51,35 @@ def test_three_dots_detection():
                 duration=1,
                 button='left'
             )
+
+        delay = first_delay
+
+        for attempt in range(1, attempts+1):
+            logging.info(f"Attempt {attempt}/{attempts}")
             
-            location = pyautogui.locateCenterOnScreen(
+            # mss grab of the right-hand strip only, matched with cv2.matchTemplate
+            location = locate_center(
                 image_path,
                 confidence=confidence,
                 grayscale=grayscale,
-                region=region
+                region=custom_region
             )
             
             if location:
-                logging.success(f"Found at {location} with confidence >= {confidence}")
+                logging.info(f"Found at {location} with confidence >= {confidence}")
                 pyautogui.moveTo(location)
                 return True
                 
             logging.warning("Not found in this attempt")
-            time.sleep(delay_between_attempts)
+            if attempt < attempts:
+                time.sleep(delay)
+                delay = min(delay * 2, max_delay)
 
         logging.error("All attempts failed")
+        if debug_overlay:
+            # Capture part of the search area for debugging
+            test_region = (custom_region[0], custom_region[1], 300, 200)
+            pyautogui.screenshot("debug_screenshot.png", region=test_region)
         return False
 
     except Exception as e:
@@ -84,8 +88,4 @@ def test_three_dots_detection():
 
 if __name__ == '__main__':
     time.sleep(5)  # Added initial delay
-    test_three_dots_detection()
-
-# Capture current screen area for debugging
-test_region = (custom_region[0], custom_region[1], 300, 200)  # Capture part of search area
-pyautogui.screenshot("debug_screenshot.png", region=test_region)
\ No newline at end of file
+    test_three_dots_detection()
\ No newline at end of file
@@ -1,18 +1,34 @@
 import os
 import json
+import hashlib
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, Optional
 from pathlib import Path
-from elevenlabs.client import ElevenLabs
-from elevenlabs import Voice, VoiceSettings
-from dotenv import load_dotenv
-import re
 
-load_dotenv()
+from core.voice_generator_clean import CLEANUP_PATTERNS, clean_script
+
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.DEBUG)  # Ensure debug logs are captured
 
+# Section keys in the order they are read out
+_NARRATION_ORDER = ('hook', 'headlines', *(f'main_story_{i}' for i in range(1, 10)), 'outro')
+
+# O_BINARY matters on Windows, where os.open would otherwise translate newlines
+_AUDIO_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+# Sections synthesized concurrently when the config does not say otherwise
+DEFAULT_TTS_CONCURRENCY = 4
+# Cached section audio unused for this long is pruned after each run
+DEFAULT_TTS_CACHE_MAX_AGE_DAYS = 7
+
+def _write_all(fd: int, data: bytes):
+    """os.write until every byte is out; memoryview slices avoid copying on short writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
 class VoiceGenerator:
     """
     VoiceGenerator uses ElevenLabs to convert final narration scripts into speech files.
@@ -25,7 +41,18 @@ class VoiceGenerator:
          that TTS should not speak (such as *, _, #, ^, `, { }, and stray angle brackets).
     """
 
+    # Cleanup patterns _clean_script runs, compiled once at import and shared by every
+    # instance and by tests that drive the cleaner directly
+    _PATTERNS = CLEANUP_PATTERNS
+
     def __init__(self, config: Dict):
+        # Imported here so merely importing this module (e.g. to test the cleaner)
+        # does not pay for elevenlabs and its pydantic/httpx stack
+        from dotenv import load_dotenv
+        from elevenlabs import Voice, VoiceSettings
+        from elevenlabs.client import ElevenLabs
+
+        load_dotenv()
         self.config = config
         self.api_key = os.getenv("ELEVENLABS_KEY")
         if not self.api_key:
@@ -38,6 +65,9 @@ class VoiceGenerator:
         output_dir = self.config.get('output_dir', './data/speech')
         os.makedirs(output_dir, exist_ok=True)
         self.output_dir = output_dir
+        # Synthesized sections keyed by text + voice settings, so re-runs skip ElevenLabs
+        self.cache_dir = os.path.join(output_dir, '.cache')
+        os.makedirs(self.cache_dir, exist_ok=True)
         
         # Gather other config parameters
         self.voice_id = self.config.get('voice_id', '')
@@ -45,6 +75,19 @@ class VoiceGenerator:
         self.stability = self.config.get('stability', 0.7)
         self.similarity_boost = self.config.get('similarity_boost', 0.7)
         self.filename_format = self.config.get('filename_format', '%Y%m%d_%H%M%S_speech.mp3')
+        self.cache_max_age_s = 86400 * float(self.config.get('tts_cache_max_age_days', DEFAULT_TTS_CACHE_MAX_AGE_DAYS))
+        self.tts_concurrency = max(1, int(self.config.get('tts_concurrency', DEFAULT_TTS_CONCURRENCY)))
+        self.voice = Voice(
+            voice_id=self.voice_id,
+            settings=VoiceSettings(
+                stability=self.stability,
+                similarity_boost=self.similarity_boost,
+                style=0.0,  # Additional parameter if needed
+                use_speaker_boost=True
+            )
+        )
+        # Voice part of the TTS cache key, encoded once; only the text varies per call
+        self._voice_cache_tag = f"|{self.voice_id}|{self.model_id}|{self.stability}|{self.similarity_boost}".encode()
 
     def generate_speech(self, script_data: Dict) -> Optional[str]:
         """
@@ -65,51 +108,41 @@ class VoiceGenerator:
             return None
         
         # 2) Assemble full script in desired order
-        narration_order = (
-            ['hook', 'headlines'] +
-            [f'main_story_{i}' for i in range(1, 10)] +
-            ['outro']
-        )
         raw_script_list = []
-        for section_key in narration_order:
-            if section_key in sections and sections[section_key].strip():
-                raw_script_list.append(sections[section_key].strip())
+        for section_key in _NARRATION_ORDER:
+            value = sections.get(section_key)
+            if value and (stripped := value.strip()):
+                raw_script_list.append(stripped)
         
-        full_script = "\n\n".join(raw_script_list)
-        if not full_script.strip():
+        if not raw_script_list:
             logger.error("No valid content to speak after assembling sections.")
             return None
         
-        # 3) Clean script text for TTS: remove <think> tags, unwanted punctuation, and special characters.
-        cleaned_script = self._clean_script(full_script)
+        # 3) Clean each section for TTS: remove <think> tags, unwanted punctuation, and special characters.
+        cleaned_sections = [c for c in map(self._clean_script, raw_script_list) if c]
+        cleaned_script = " ".join(cleaned_sections)
         if not cleaned_script:
             logger.error("No valid narration content found after cleaning.")
             return None
 
         # 4) Generate filename from config's filename_format
-        filename = datetime.now().strftime(self.filename_format)
+        filename = time.strftime(self.filename_format)
         output_path = os.path.join(self.output_dir, filename)
         
-        # 5) Call ElevenLabs TTS
+        # 5) Call ElevenLabs TTS, one request per section, stitched in narration order
         try:
-            logger.info("Attempting ElevenLabs speech generation...")
-            audio_stream = self.client.generate(
-                text=cleaned_script,
-                voice=Voice(
-                    voice_id=self.voice_id,
-                    settings=VoiceSettings(
-                        stability=self.stability,
-                        similarity_boost=self.similarity_boost,
-                        style=0.0,  # Additional parameter if needed
-                        use_speaker_boost=True
-                    )
-                ),
-                model=self.model_id
-            )
-            
-            with open(output_path, "wb") as f:
-                for chunk in audio_stream:
-                    f.write(chunk)
+            logger.info(f"Attempting ElevenLabs speech generation for {len(cleaned_sections)} sections...")
+            workers = min(self.tts_concurrency, len(cleaned_sections))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                # map() yields in submission order, so earlier sections are written
+                # while later ones are still being synthesized. Each section arrives
+                # whole, so it goes straight to the descriptor without a buffer copy
+                fd = os.open(output_path, _AUDIO_OPEN_FLAGS, 0o644)
+                try:
+                    for audio in pool.map(self._synthesize_section, cleaned_sections):
+                        _write_all(fd, audio)
+                finally:
+                    os.close(fd)
             
             logger.info(f"ElevenLabs speech generated: {output_path}")
             return output_path
@@ -118,6 +151,58 @@ class VoiceGenerator:
             logger.error(f"ElevenLabs generation failed: {e}")
             logger.info("Attempting fallback TTS (gTTS)...")
             return self._generate_fallback_tts(cleaned_script, output_path)
+        finally:
+            self._prune_cache()
+
+    def _synthesize_section(self, text: str) -> bytes:
+        """Synthesize one section with ElevenLabs and return its MP3 bytes, reusing cached audio."""
+        cache_path = os.path.join(self.cache_dir, f"{self._cache_key(text)}.mp3")
+        try:
+            with open(cache_path, "rb") as f:
+                logger.debug(f"TTS cache hit: {cache_path}")
+                audio = f.read()
+            # Touch the entry so pruning measures age from last use, not creation
+            os.utime(cache_path)
+            return audio
+        except FileNotFoundError:
+            pass
+
+        audio_stream = self.client.generate(text=text, voice=self.voice, model=self.model_id)
+        audio = b"".join(audio_stream)
+
+        # Write aside and rename, so a crash or a concurrent run never leaves a partial entry
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(audio)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not cache TTS audio: {e}")
+        return audio
+
+    def _prune_cache(self):
+        """Delete cache entries (and stray temp files) not used within cache_max_age_s."""
+        cutoff = time.time() - self.cache_max_age_s
+        removed = 0
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file() and entry.stat().st_mtime < cutoff:
+                            os.unlink(entry.path)
+                            removed += 1
+                    except OSError as e:
+                        logger.warning(f"Could not prune TTS cache entry {entry.path}: {e}")
+        except OSError as e:
+            logger.warning(f"Could not prune TTS cache: {e}")
+        if removed:
+            logger.info(f"Pruned {removed} stale TTS cache entries")
+
+    def _cache_key(self, text: str) -> str:
+        # blake2b is faster than sha256 in hashlib; 128 bits is plenty for a cache key
+        digest = hashlib.blake2b(text.encode(), digest_size=16)
+        digest.update(self._voice_cache_tag)
+        return digest.hexdigest()
 
     def _generate_fallback_tts(self, text: str, output_path: str) -> Optional[str]:
         """Fallback TTS using gTTS if ElevenLabs fails."""
@@ -134,37 +219,7 @@ class VoiceGenerator:
     def _clean_script(self, script: str) -> str:
         """Enhanced cleaning to remove all asterisk-enclosed content"""
         try:
-            # Remove <think> tags first
-            script = re.sub(r'<think>.*?</think>', '', script, flags=re.DOTALL | re.IGNORECASE)
-            
-            # New: Remove any content between asterisks (1+ asterisks on both sides)
-            script = re.sub(r'\*{1,}(?!\s*$).*?\*{1,}', '', script, flags=re.DOTALL)
-            
-            # New: Remove lines starting/ending with asterisks (catch malformed patterns)
-            script = re.sub(r'^\*+.*', '', script, flags=re.MULTILINE)
-            script = re.sub(r'.*\*+$', '', script, flags=re.MULTILINE)
-            
-            # Existing cleanup patterns
-            script = re.sub(r'\[[^\]]*\]', '', script)
-            script = re.sub(r'\([^)]*\)', '', script)
-            script = re.sub(r'[^a-zA-Z0-9\s.,!?\'’]', '', script)
-            
-            # Normalize and return
-            script = re.sub(r'\s+', ' ', script).strip()
-            
-            # Split into sentences and ensure proper sentence termination
-            sentences = re.split(r'(?<=[.!?]) +', script)
-            cleaned_sentences = []
-            for sent in sentences:
-                sent = sent.strip()
-                if sent:
-                    sent = sent[0].upper() + sent[1:]
-                    if not sent.endswith((".", "!", "?")):
-                        sent += "."
-                    cleaned_sentences.append(sent)
-            
-            return ' '.join(cleaned_sentences)
-            
+            return clean_script(script)
         except Exception as e:
             logger.error(f"Script cleaning failed: {e}")
             return ""
@@ -0,0 +1,93 @@
+# TTS script cleaner, kept free of third-party imports and fully annotated so it
+# can be AOT-compiled (e.g. `mypyc src/core/voice_generator_clean.py`) without
+# touching VoiceGenerator. Runs unchanged as plain Python.
+import re
+
+# LLM meta-prefixes that must never be read out. Add phrases here, not to the
+# regex: they are matched case-insensitively with either apostrophe, in the
+# same scan as the spans. Each must end with a colon (see _SPAN_TRIGGERS)
+_META_PHRASES = (
+    "Revised News Script Section:",
+    "Here's a revised version:",
+    "Here's the script:",
+    "Here is the revised script:",
+)
+_META_PHRASE_ALT = '|'.join(
+    re.escape(p).replace("'", "['’]") for p in sorted(_META_PHRASES, key=len, reverse=True)
+)
+# Think blocks, asterisk-enclosed spans and meta phrases, in one scan. Spans go
+# before the line rules so those only see the stray asterisks left over, exactly
+# as in separate passes. The span body is `[^*]*` (it can only stop at the next
+# asterisk anyway) rather than a lazy `.*?`, so stray asterisks cannot make it backtrack.
+_SPAN_RE = re.compile(r'(?is:<think>.*?</think>)|\*+(?!\s*\Z)[^*]*\*+|(?i:' + _META_PHRASE_ALT + ')')
+# Every _SPAN_RE match contains one of these; text without any skips the scan
+_SPAN_TRIGGERS = ('*', '<', ':')
+# Bracketed, then parenthesized asides, each run only when its opener is present.
+# Two passes rather than one alternation, so interleaved asides such as "([)]"
+# resolve brackets first, as they always have
+_BRACKET_RE = re.compile(r'\[[^\]]*\]')
+_PAREN_RE = re.compile(r'\([^)]*\)')
+_BAD_CHARS_RE = re.compile(r'[^a-zA-Z0-9\s.,!?\'’]')
+# The same whitelist as a str.translate table for ASCII (built from the regex, so the
+# two cannot drift); only non-ASCII text needs the straggler regex afterwards
+_ASCII_DELETE = dict.fromkeys(i for i in range(128) if _BAD_CHARS_RE.match(chr(i)))
+_NON_ASCII_BAD_RE = re.compile(r'[^\x00-\x7f\s’]+')
+_WS_RE = re.compile(r'\s+')
+# Sentence boundaries once whitespace is collapsed to single spaces
+_SENT_DELIMITERS = ('. ', '! ', '? ')
+
+# Everything clean_script compiles, for callers and tests that want the shared set
+CLEANUP_PATTERNS = (_SPAN_RE, _BRACKET_RE, _PAREN_RE, _BAD_CHARS_RE, _NON_ASCII_BAD_RE, _WS_RE)
+
+def _drop_asterisk_lines(text: str) -> str:
+    """Drop lines that start or end with an asterisk.
+
+    A plain line walk: several times faster than the equivalent anchored
+    multiline regexes, which try a match at every line start.
+    """
+    return '\n'.join(
+        line for line in text.split('\n')
+        if not (line.startswith('*') or line.endswith('*'))
+    )
+
+def _capitalize_sentences(text: str) -> str:
+    """Uppercase the first character of each sentence in single-spaced text.
+
+    str.split/join per delimiter run in C; faster than a regex sub with a
+    Python callback per sentence, or a Python-level character walk.
+    """
+    for delimiter in _SENT_DELIMITERS:
+        first, *rest = text.split(delimiter)
+        if rest:
+            text = delimiter.join([first, *(part[:1].upper() + part[1:] for part in rest)])
+    return text[:1].upper() + text[1:]
+
+def clean_script(script: str) -> str:
+    """Strip everything TTS should not read and normalize sentences for narration."""
+    # Remove <think> blocks, asterisk-enclosed content and asterisk lines,
+    # then bracketed and parenthesized asides
+    # Most sections contain none of the markup, so each pass is gated
+    # on a substring test that is far cheaper than a failed scan
+    if any(c in script for c in _SPAN_TRIGGERS):
+        script = _SPAN_RE.sub('', script)
+    if '*' in script:
+        script = _drop_asterisk_lines(script)
+    if '[' in script:
+        script = _BRACKET_RE.sub('', script)
+    if '(' in script:
+        script = _PAREN_RE.sub('', script)
+
+    # Drop characters TTS should not speak
+    script = script.translate(_ASCII_DELETE)
+    if not script.isascii():
+        script = _NON_ASCII_BAD_RE.sub('', script)
+
+    # Normalize and return
+    script = _WS_RE.sub(' ', script).strip()
+
+    # Capitalize every sentence start; only the last sentence can lack a
+    # terminator, since the others end at a delimiter
+    script = _capitalize_sentences(script)
+    if script and not script.endswith((".", "!", "?")):
+        script += "."
+    return script
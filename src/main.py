@@ -1,10 +1,16 @@
 import os
 import json
+import functools
 import logging
 from datetime import datetime
 import yaml
 import traceback
 
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml bindings
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from core.news_aggregator import NewsAggregator
 from core.script_generator import ScriptGenerator
 
@@ -21,11 +27,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=4)
+def _parse_config(config_path: str, mtime_ns: int) -> dict:
+    # mtime is part of the key so an edited file is parsed again
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
 def load_config(config_path: str) -> dict:
-    """Load YAML configuration file."""
+    """Load YAML configuration file (parsed once per file version; treat the result as read-only)."""
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config_path = os.path.realpath(config_path)
+        config = _parse_config(config_path, os.stat(config_path).st_mtime_ns)
         logger.debug("Configuration loaded successfully.")
         return config
     except FileNotFoundError:
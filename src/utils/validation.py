@@ -1,8 +1,23 @@
 # src/utils/validation.py
-def validate_script(script: Dict) -> bool:
-    requirements = {
-        'title': (lambda x: 10 <= len(x) <= 80),
-        'duration': (lambda x: 180 <= x <= 300),
-        'brand_mentions': (lambda x: x >= 2)
+from typing import Dict
+
+import fastjsonschema
+
+# Compiled once at import; fastjsonschema generates a plain Python function for the schema
+_SCRIPT_SCHEMA = {
+    'type': 'object',
+    'required': ['title', 'duration', 'brand_mentions'],
+    'properties': {
+        'title': {'type': 'string', 'minLength': 10, 'maxLength': 80},
+        'duration': {'type': 'number', 'minimum': 180, 'maximum': 300},
+        'brand_mentions': {'type': 'number', 'minimum': 2}
     }
-    return all(check(script.get(key)) for key, check in requirements.items())
\ No newline at end of file
+}
+_validate_script = fastjsonschema.compile(_SCRIPT_SCHEMA)
+
+def validate_script(script: Dict) -> bool:
+    try:
+        _validate_script(script)
+        return True
+    except fastjsonschema.JsonSchemaException:
+        return False
\ No newline at end of file
@@ -0,0 +1,42 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / 'src'))
+
+from core.news_aggregator import _hash_story, _parse_epoch
+
+JAN_2_2024_030405_UTC = 1704164645.0
+
+@pytest.mark.parametrize("datestr, expected", [
+    ("1700000000", 1700000000.0),
+    ("1700000000.5", 1700000000.5),
+    # Only an exact number takes the numeric branch, as with the original re.fullmatch
+    ("1700000000\n", None),
+    # ISO-8601, with Z, with offset, and naive (treated as UTC)
+    ("2024-01-02T03:04:05Z", JAN_2_2024_030405_UTC),
+    ("2024-01-02T05:04:05+02:00", JAN_2_2024_030405_UTC),
+    ("2024-01-02T03:04:05", JAN_2_2024_030405_UTC),
+    # RFC-2822, as used by RSS
+    ("Tue, 02 Jan 2024 03:04:05 GMT", JAN_2_2024_030405_UTC),
+    # Free-form falls through to dateutil
+    ("January 2, 2024 3:04:05am UTC", JAN_2_2024_030405_UTC),
+    ("", None),
+    ("not a date", None),
+])
+def test_parse_epoch(datestr, expected):
+    assert _parse_epoch(datestr) == expected
+
+def test_hash_story_normalizes_case_and_whitespace():
+    assert _hash_story("Title", " http://X.com/a ") == _hash_story("title", "http://x.com/a")
+
+def test_hash_story_distinguishes_stories():
+    assert _hash_story("title", "http://x.com/a") != _hash_story("title", "http://x.com/b")
+    # The separator keeps title/link boundaries apart
+    assert _hash_story("ab", "c") != _hash_story("a", "bc")
+
+def test_hash_story_is_64_bit():
+    assert 0 <= _hash_story("title", "http://x.com/a") < 2 ** 64
@@ -0,0 +1,75 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / 'src'))
+
+from core.script_generator import ScriptGenerator, _ThinkFilter
+
+def _feed_all(chunks):
+    think = _ThinkFilter()
+    return ''.join(think.feed(chunk) for chunk in chunks) + think.flush()
+
+@pytest.mark.parametrize("chunks, expected", [
+    (["Hello world"], "Hello world"),
+    (["<think>plan</think>Hello"], "Hello"),
+    # Tags split across chunks
+    (["Hello <th", "ink>secret</thi", "nk> world"], "Hello  world"),
+    (["a<", "think>x</think>", "b"], "ab"),
+    # A '<' that never becomes a tag is released
+    (["1 <", " 2"], "1 < 2"),
+    (["Hi <b>"], "Hi <b>"),
+    # Unterminated think block is dropped
+    (["a<think>never closed"], "a"),
+])
+def test_think_filter(chunks, expected):
+    assert _feed_all(chunks) == expected
+
+def test_think_filter_holds_back_partial_tag():
+    think = _ThinkFilter()
+    assert think.feed("Hello <th") == "Hello "
+    assert think.feed("ink>x</think>!") == "!"
+    assert think.flush() == ""
+
+@pytest.fixture
+def generator():
+    # Only the pure text helpers are exercised; no clients are needed
+    return ScriptGenerator.__new__(ScriptGenerator)
+
+def test_final_tts_filter_skips_gemini_without_markup(generator, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("Gemini should not be called")
+    monkeypatch.setattr(generator, '_call_gemini', fail)
+    script = {"sections": {"hook": "Good evening.", "headlines": "Top *stories* today.", "count": 3}}
+    assert generator._final_tts_filter(script) == "Good evening. Top stories today."
+    assert generator._final_tts_filter("plain text") == "plain text"
+
+def test_final_tts_filter_uses_gemini_when_markup_survives(generator, monkeypatch):
+    monkeypatch.setattr(generator, '_call_gemini', lambda prompt, **kwargs: "Clean *text*")
+    assert generator._final_tts_filter("Top [pause] stories") == "Clean text"
+
+def test_final_tts_filter_falls_back_when_gemini_returns_nothing(generator, monkeypatch):
+    monkeypatch.setattr(generator, '_call_gemini', lambda prompt, **kwargs: "")
+    assert generator._final_tts_filter("Top [pause] stories") == "Top [pause] stories"
+
+def test_gemini_tts_cleanup_falls_back_when_gemini_returns_nothing(generator, monkeypatch):
+    monkeypatch.setattr(generator, '_call_gemini', lambda prompt, **kwargs: "")
+    assert generator._gemini_tts_cleanup("Script Section: Markets  [note] rose") == "Markets rose"
+
+def test_needs_refinement_always_refines_untouched_input(generator):
+    short = "Good evening, and welcome to the news."
+    assert generator._needs_refinement(short)
+    assert not generator._needs_refinement("   ")
+
+def test_needs_refinement_stops_on_settled_or_short_revisions(generator):
+    short = "Good evening, and welcome to the news."
+    # A short, well-formed revision is done
+    assert not generator._needs_refinement(short, "Hello, welcome to news")
+    # A revision that barely changed the text is done, whatever its length
+    long_text = " ".join(["Markets rallied on strong earnings reports."] * 20)
+    assert not generator._needs_refinement(long_text + "!", long_text + ".")
+    # A long revision that still changed a lot gets another round
+    assert generator._needs_refinement(long_text, "Something completely different.")
@@ -0,0 +1,35 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / 'src'))
+
+from utils.validation import validate_script
+
+VALID = {'title': 'Evening news roundup', 'duration': 240, 'brand_mentions': 2}
+
+def test_valid_script():
+    assert validate_script(VALID)
+
+@pytest.mark.parametrize("overrides", [
+    {'title': 'Too short'},
+    {'title': 'x' * 81},
+    {'duration': 179},
+    {'duration': 301},
+    {'brand_mentions': 1},
+    {'duration': '240'},
+])
+def test_invalid_values(overrides):
+    assert not validate_script({**VALID, **overrides})
+
+@pytest.mark.parametrize("missing", ['title', 'duration', 'brand_mentions'])
+def test_missing_keys(missing):
+    script = {k: v for k, v in VALID.items() if k != missing}
+    assert not validate_script(script)
+
+def test_boundaries_are_inclusive():
+    assert validate_script({'title': 'x' * 10, 'duration': 180, 'brand_mentions': 2})
+    assert validate_script({'title': 'x' * 80, 'duration': 300, 'brand_mentions': 5})
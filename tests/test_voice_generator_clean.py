@@ -0,0 +1,39 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / 'src'))
+
+from core.voice_generator_clean import clean_script
+
+@pytest.mark.parametrize("raw, expected", [
+    # Think blocks, any case, across lines
+    ("<think>plan the intro</think>good evening, everyone", "Good evening, everyone."),
+    ("<THINK>\nmulti\nline\n</THINK>Hello there.", "Hello there."),
+    # Asterisk-enclosed spans and stray asterisk lines
+    ("Stocks **sharply** rose today.", "Stocks rose today."),
+    ("Markets rallied.\n* stray bullet\nPrices fell", "Markets rallied. Prices fell."),
+    ("Markets rallied.\nPrices fell *\nBonds held", "Markets rallied. Bonds held."),
+    ("the end **", "The end."),
+    ("***", ""),
+    # Bracketed and parenthesized asides; brackets are resolved before parens
+    ("The vote passed [pause] yesterday (local time).", "The vote passed yesterday ."),
+    ("(][)\tx y ]a", "A."),
+    # LLM meta phrases, case-insensitive, either apostrophe
+    ("Revised News Script Section: Markets rose.", "Markets rose."),
+    ("here’s the script: rain is coming.", "Rain is coming."),
+    # Characters TTS should not speak, including non-ASCII
+    ("It's a win # for `all` {fans} ^_^", "It's a win for all fans."),
+    ("said “hello” — and left", "Said hello and left."),
+    ("Café prices rose 5%, analysts said", "Caf prices rose 5, analysts said."),
+    # Whitespace collapse, sentence capitalization and final terminator
+    ("first point. second point! third point? fourth point",
+     "First point. Second point! Third point? Fourth point."),
+    ("one.  two\n\nthree", "One. Two three."),
+    ("", ""),
+])
+def test_clean_script(raw, expected):
+    assert clean_script(raw) == expected